@@ -12,10 +12,14 @@ import json
 import logging
 import shutil
 import sqlite3
+import sys
 import threading
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Optional
 
 from components.interfaces import Config
 
@@ -23,6 +27,9 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_DB_PATH = Path("cache/cache.db")
 _DEFAULT_DOCS_DB_PATH = Path("cache/docs.db")
+# Bounds on the in-memory discover() memo
+_DISCOVER_MEMO_MAX_ENTRIES = 1024
+_DISCOVER_MEMO_TTL_SECONDS = 600.0
 
 _CACHE_SCHEMA = """
 PRAGMA journal_mode=WAL;
@@ -101,6 +108,30 @@ CREATE TABLE IF NOT EXISTS committee_parsers (
     is_last_parser INTEGER NOT NULL DEFAULT 0,
     PRIMARY KEY (committee_id, parser_type, module_name)
 );
+
+CREATE TABLE IF NOT EXISTS parser_stats (
+    parser_type TEXT NOT NULL,
+    module_name TEXT NOT NULL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    failures    INTEGER NOT NULL DEFAULT 0,
+    updated_at  TEXT,
+    PRIMARY KEY (parser_type, module_name)
+);
+
+CREATE TABLE IF NOT EXISTS llm_decisions (
+    key        TEXT PRIMARY KEY,
+    decision   TEXT NOT NULL,
+    created_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS llm_rejections (
+    bill_id     TEXT NOT NULL,
+    parser_type TEXT NOT NULL,
+    module_name TEXT NOT NULL,
+    url_hash    TEXT NOT NULL,
+    created_at  TEXT,
+    PRIMARY KEY (bill_id, parser_type, module_name, url_hash)
+);
 """
 
 _DOCS_SCHEMA = """
@@ -141,6 +172,29 @@ def _now() -> str:
     )
 
 
+def _cutoff(max_age_days: int) -> str:
+    """Timestamp in _now() format for rows exactly max_age_days old."""
+    return (
+        (datetime.now(timezone.utc) - timedelta(days=max_age_days))
+        .isoformat(timespec="seconds")
+        .replace("+00:00", "Z")
+    )
+
+
+def _loads_or_none(raw: Optional[str]) -> Optional[dict]:
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+
+
+def _result_dict(result: Any) -> dict:
+    """Accept a result model (SummaryInfo/VoteInfo) or an already-built dict."""
+    return result if isinstance(result, dict) else result.to_dict()
+
+
 def _open_db(path: Path, schema: str) -> sqlite3.Connection:
     path.parent.mkdir(parents=True, exist_ok=True)
     # isolation_level=None → autocommit; each execute() is immediately durable.
@@ -168,6 +222,20 @@ class CacheDB:
         # Mirrors committee_bills in memory for hot-path O(1) membership checks
         self._committee_bills_cache: dict[str, set[str]] = {}
         self._load_committee_bills_cache()
+        # Mirrors confirmed rows of bill_parsers / bill_votes_by_committee as
+        # (module, parsed result) so the resolver fast path skips SQL and JSON.
+        # A None result means the row has no usable result_json.
+        self._confirmed: dict[tuple[str, str], tuple[str, Optional[dict]]] = {}
+        self._confirmed_votes: dict[tuple[str, str], tuple[str, Optional[dict]]] = {}
+        self._load_confirmed_index()
+        # committee_parsers stats by (committee_id, parser_type), filled on
+        # first read and dropped whenever record_committee_parser touches them
+        self._committee_stats: dict[tuple[str, str], dict[str, dict[str, int]]] = {}
+        # discover() results as (monotonic timestamp, result), LRU-ordered;
+        # in memory only, never persisted
+        self._discover_memo: OrderedDict[tuple[str, ...], tuple[float, Any]] = (
+            OrderedDict()
+        )
 
     def _load_committee_bills_cache(self) -> None:
         for row in self._conn.execute(
@@ -178,6 +246,25 @@ class CacheDB:
                 self._committee_bills_cache[cid] = set()
             self._committee_bills_cache[cid].add(row["bill_id"])
 
+    def _load_confirmed_index(self) -> None:
+        # Only a handful of distinct modules back thousands of bills; intern
+        # them so the index shares one string each and matches registry keys
+        for row in self._conn.execute(
+            "SELECT bill_id, kind, module, result_json FROM bill_parsers WHERE confirmed=1"
+        ):
+            self._confirmed[(row["bill_id"], row["kind"])] = (
+                sys.intern(row["module"]),
+                _loads_or_none(row["result_json"]),
+            )
+        for row in self._conn.execute(
+            "SELECT bill_id, committee_id, module, result_json"
+            " FROM bill_votes_by_committee WHERE confirmed=1"
+        ):
+            self._confirmed_votes[(row["bill_id"], row["committee_id"])] = (
+                sys.intern(row["module"]),
+                _loads_or_none(row["result_json"]),
+            )
+
     # ------------------------------------------------------------------
     # save / force_save -- no-ops; SQLite writes are immediate per statement
     # ------------------------------------------------------------------
@@ -188,6 +275,45 @@ class CacheDB:
     def force_save(self) -> None:
         pass
 
+    # ------------------------------------------------------------------
+    # Batched writes -- one transaction instead of one commit per statement
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """Group the cache writes made inside the block into one transaction.
+
+        The cache lock is held for the whole block, so other threads wait
+        instead of writing into the transaction; keep the block to cache
+        calls. A nested block joins the outer one. If the block raises, the
+        transaction is rolled back.
+        """
+        with self._lock:
+            if self._conn.in_transaction:
+                yield
+                return
+            self._conn.execute("BEGIN")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                self._reload_mirrors()
+                raise
+            self._conn.execute("COMMIT")
+
+    def _reload_mirrors(self) -> None:
+        """Rebuild the in-memory mirrors after a rollback discarded writes.
+
+        Only called with the lock held, so the discarded writes were this
+        thread's own.
+        """
+        self._committee_bills_cache.clear()
+        self._load_committee_bills_cache()
+        self._confirmed.clear()
+        self._confirmed_votes.clear()
+        self._load_confirmed_index()
+        self._committee_stats.clear()
+
     # ------------------------------------------------------------------
     # Session
     # ------------------------------------------------------------------
@@ -233,6 +359,8 @@ class CacheDB:
                     "committee_contacts",
                     "committee_bills",
                     "committee_parsers",
+                    "llm_decisions",
+                    "llm_rejections",
                 ):
                     self._conn.execute(f"DELETE FROM {table}")  # noqa: S608
                 self._conn.execute(
@@ -240,6 +368,9 @@ class CacheDB:
                     (current_session,),
                 )
                 self._committee_bills_cache.clear()
+                self._confirmed.clear()
+                self._confirmed_votes.clear()
+                self._committee_stats.clear()
                 logger.info("Started fresh cache for session %s", current_session)
 
     # ------------------------------------------------------------------
@@ -262,6 +393,21 @@ class CacheDB:
             ).fetchone()
         return bool(row["confirmed"]) if row else False
 
+    def get_confirmed_parser(self, bill_id: str, kind: str) -> Optional[str]:
+        """Return the parser module only if it has been confirmed."""
+        return self.get_confirmed_entry(bill_id, kind)[0]
+
+    def get_confirmed_entry(
+        self, bill_id: str, kind: str
+    ) -> tuple[Optional[str], Optional[dict]]:
+        """Return (module, result) if confirmed, else (None, None), in one lookup.
+
+        The dict is shared with the in-memory index; callers must not mutate it.
+        """
+        with self._lock:
+            entry = self._confirmed.get((bill_id, kind))
+        return entry if entry else (None, None)
+
     def set_parser(
         self, bill_id: str, kind: str, module_name: str, *, confirmed: bool
     ) -> None:
@@ -277,6 +423,13 @@ class CacheDB:
                 """,
                 (bill_id, kind, module_name, int(confirmed), _now()),
             )
+            if confirmed:
+                self._confirmed[(bill_id, kind)] = (
+                    module_name,
+                    self.get_result(bill_id, kind),
+                )
+            else:
+                self._confirmed.pop((bill_id, kind), None)
 
     def get_result(self, bill_id: str, kind: str) -> Optional[dict]:
         with self._lock:
@@ -296,10 +449,12 @@ class CacheDB:
         bill_id: str,
         kind: str,
         module_name: str,
-        result_data: dict,
+        result_data: Any,
         *,
         confirmed: bool,
     ) -> None:
+        """Store a bill's result; result_data may be a dict or a result model."""
+        result_data = _result_dict(result_data)
         with self._lock:
             self._conn.execute(
                 """
@@ -313,6 +468,10 @@ class CacheDB:
                 """,
                 (bill_id, kind, module_name, int(confirmed), json.dumps(result_data), _now()),
             )
+            if confirmed:
+                self._confirmed[(bill_id, kind)] = (module_name, result_data)
+            else:
+                self._confirmed.pop((bill_id, kind), None)
 
     # ------------------------------------------------------------------
     # Votes per committee (votes_by_committee)
@@ -349,15 +508,42 @@ class CacheDB:
                 return None
         return self.get_result(bill_id, "votes")
 
+    def get_confirmed_votes_parser(
+        self, bill_id: str, committee_id: str
+    ) -> Optional[str]:
+        """Return the committee's votes parser only if it has been confirmed."""
+        with self._lock:
+            entry = self._confirmed_votes.get((bill_id, committee_id))
+        return entry[0] if entry else None
+
+    def get_confirmed_votes_entry(
+        self, bill_id: str, committee_id: str
+    ) -> tuple[Optional[str], Optional[dict]]:
+        """Return (module, result) for a confirmed committee votes parser.
+
+        (None, None) if unconfirmed. Like get_votes_result, a confirmed row
+        without stored JSON falls back to the legacy bill-level votes result.
+        The dict is shared with the in-memory index; callers must not mutate it.
+        """
+        with self._lock:
+            entry = self._confirmed_votes.get((bill_id, committee_id))
+        if not entry:
+            return None, None
+        if entry[1] is not None:
+            return entry
+        return entry[0], self.get_result(bill_id, "votes")
+
     def set_votes_result(
         self,
         bill_id: str,
         committee_id: str,
         module_name: str,
-        result_data: dict,
+        result_data: Any,
         *,
         confirmed: bool,
     ) -> None:
+        """Store a committee's votes result; result_data may be a dict or model."""
+        result_data = _result_dict(result_data)
         with self._lock:
             self._conn.execute(
                 """
@@ -372,6 +558,13 @@ class CacheDB:
                 """,
                 (bill_id, committee_id, module_name, int(confirmed), json.dumps(result_data), _now()),
             )
+            if confirmed:
+                self._confirmed_votes[(bill_id, committee_id)] = (
+                    module_name,
+                    result_data,
+                )
+            else:
+                self._confirmed_votes.pop((bill_id, committee_id), None)
 
     def set_votes_parser(
         self,
@@ -394,6 +587,18 @@ class CacheDB:
                 """,
                 (bill_id, committee_id, module_name, int(confirmed), _now()),
             )
+            if confirmed:
+                row = self._conn.execute(
+                    "SELECT result_json FROM bill_votes_by_committee"
+                    " WHERE bill_id=? AND committee_id=?",
+                    (bill_id, committee_id),
+                ).fetchone()
+                self._confirmed_votes[(bill_id, committee_id)] = (
+                    module_name,
+                    _loads_or_none(row["result_json"]),
+                )
+            else:
+                self._confirmed_votes.pop((bill_id, committee_id), None)
 
     # ------------------------------------------------------------------
     # Extensions
@@ -593,32 +798,74 @@ class CacheDB:
     # ------------------------------------------------------------------
 
     def get_committee_parsers(self, committee_id: str, parser_type: str) -> list[str]:
+        """Committee parsers, those on a streak of 2+ first, then by count.
+
+        Served from the same per-committee memo as get_parser_stats, so bills
+        from one committee share a single query until the stats change.
+        """
         with self._lock:
-            rows = self._conn.execute(
-                """
-                SELECT module_name
-                FROM committee_parsers
-                WHERE committee_id=? AND parser_type=?
-                ORDER BY
-                    CASE WHEN current_streak >= 2 THEN 1 ELSE 0 END DESC,
-                    count DESC
-                """,
-                (committee_id, parser_type),
-            ).fetchall()
-        return [row["module_name"] for row in rows]
+            stats = self._load_committee_stats(committee_id, parser_type)
+            return sorted(
+                stats,
+                key=lambda module: (
+                    stats[module]["current_streak"] < 2,
+                    -stats[module]["count"],
+                ),
+            )
+
+    def get_trusted_committee_parser(
+        self, committee_id: str, parser_type: str, min_count: int
+    ) -> Optional[str]:
+        """The committee's parser if it is the only one that has ever won.
+
+        Returns None unless exactly one parser is recorded for the committee
+        and it has won at least min_count times.
+        """
+        if min_count < 1:
+            return None
+        with self._lock:
+            stats = self._load_committee_stats(committee_id, parser_type)
+            if len(stats) != 1:
+                return None
+            ((module_name, module_stats),) = stats.items()
+        return module_name if module_stats["count"] >= min_count else None
 
     def get_committee_parser_stats(
         self, committee_id: str, parser_type: str, module_name: str
     ) -> dict[str, int]:
+        stats = self.get_parser_stats(committee_id, parser_type, module_name)
+        return dict(stats) if stats else {}
+
+    def get_parser_stats(
+        self, committee_id: str, parser_type: str, module_name: str
+    ) -> Optional[dict[str, int]]:
+        """Return {"count", "current_streak"} for a committee parser, or None.
+
+        The dict is shared with the in-memory memo; callers must not mutate it.
+        """
         with self._lock:
-            row = self._conn.execute(
-                "SELECT count, current_streak FROM committee_parsers"
-                " WHERE committee_id=? AND parser_type=? AND module_name=?",
-                (committee_id, parser_type, module_name),
-            ).fetchone()
-        if not row:
-            return {}
-        return {"count": row["count"], "current_streak": row["current_streak"]}
+            stats = self._load_committee_stats(committee_id, parser_type)
+        return stats.get(module_name)
+
+    def _load_committee_stats(
+        self, committee_id: str, parser_type: str
+    ) -> dict[str, dict[str, int]]:
+        """Memoized committee_parsers stats by module; call with _lock held."""
+        stats = self._committee_stats.get((committee_id, parser_type))
+        if stats is None:
+            stats = {
+                row["module_name"]: {
+                    "count": row["count"],
+                    "current_streak": row["current_streak"],
+                }
+                for row in self._conn.execute(
+                    "SELECT module_name, count, current_streak"
+                    " FROM committee_parsers WHERE committee_id=? AND parser_type=?",
+                    (committee_id, parser_type),
+                )
+            }
+            self._committee_stats[(committee_id, parser_type)] = stats
+        return stats
 
     def record_committee_parser(
         self, committee_id: str, parser_type: str, module_name: str
@@ -660,6 +907,163 @@ class CacheDB:
                 """,
                 (committee_id, parser_type, module_name, now, now),
             )
+            # Streaks of every parser for this committee/type may have changed
+            self._committee_stats.pop((committee_id, parser_type), None)
+
+    def record_success(
+        self,
+        bill_id: str,
+        committee_id: str,
+        parser_type: str,
+        module_name: str,
+        result_data: Any,
+        *,
+        confirmed: bool,
+    ) -> None:
+        """Store an accepted result and credit its parser in one transaction.
+
+        Votes results are stored per committee; every other parser type is
+        stored per bill.
+        """
+        with self.batched():
+            if parser_type == "votes":
+                self.set_votes_result(
+                    bill_id,
+                    committee_id,
+                    module_name,
+                    result_data,
+                    confirmed=confirmed,
+                )
+            else:
+                self.set_result(
+                    bill_id,
+                    parser_type,
+                    module_name,
+                    result_data,
+                    confirmed=confirmed,
+                )
+            self.record_committee_parser(committee_id, parser_type, module_name)
+
+    # ------------------------------------------------------------------
+    # Parser discover() hit rates (global, kept across sessions)
+    # ------------------------------------------------------------------
+
+    def record_discover_attempt(
+        self, parser_type: str, module_name: str, found: bool
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO parser_stats
+                    (parser_type, module_name, attempts, failures, updated_at)
+                VALUES(?, ?, 1, ?, ?)
+                ON CONFLICT(parser_type, module_name) DO UPDATE SET
+                    attempts=attempts+1,
+                    failures=failures+excluded.failures,
+                    updated_at=excluded.updated_at
+                """,
+                (parser_type, module_name, int(not found), _now()),
+            )
+
+    def get_discover_stats(self, parser_type: str) -> dict[str, tuple[int, int]]:
+        """Return {module_name: (attempts, failures)} for a parser type."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT module_name, attempts, failures FROM parser_stats"
+                " WHERE parser_type=?",
+                (parser_type,),
+            ).fetchall()
+        return {row["module_name"]: (row["attempts"], row["failures"]) for row in rows}
+
+    # ------------------------------------------------------------------
+    # LLM decisions (keyed by a hash of the prompt inputs)
+    # ------------------------------------------------------------------
+
+    def get_llm_decision(self, key: str, max_age_days: int) -> Optional[str]:
+        cutoff = _cutoff(max_age_days)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT decision FROM llm_decisions WHERE key=? AND created_at >= ?",
+                (key, cutoff),
+            ).fetchone()
+        return row["decision"] if row else None
+
+    def set_llm_decision(self, key: str, decision: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO llm_decisions(key, decision, created_at) VALUES(?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    decision=excluded.decision,
+                    created_at=excluded.created_at
+                """,
+                (key, decision, _now()),
+            )
+
+    def is_llm_rejected(
+        self,
+        bill_id: str,
+        parser_type: str,
+        module_name: str,
+        url_hash: str,
+        max_age_days: int,
+    ) -> bool:
+        """Whether the LLM said "no" to this parser's document for the bill."""
+        cutoff = _cutoff(max_age_days)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM llm_rejections WHERE bill_id=? AND parser_type=?"
+                " AND module_name=? AND url_hash=? AND created_at >= ?",
+                (bill_id, parser_type, module_name, url_hash, cutoff),
+            ).fetchone()
+        return row is not None
+
+    def record_llm_rejection(
+        self, bill_id: str, parser_type: str, module_name: str, url_hash: str
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO llm_rejections(
+                    bill_id, parser_type, module_name, url_hash, created_at
+                ) VALUES(?, ?, ?, ?, ?)
+                ON CONFLICT(bill_id, parser_type, module_name, url_hash)
+                DO UPDATE SET created_at=excluded.created_at
+                """,
+                (bill_id, parser_type, module_name, url_hash, _now()),
+            )
+
+    # ------------------------------------------------------------------
+    # Discovery memo (in-memory LRU with TTL, cleared per pipeline run)
+    # ------------------------------------------------------------------
+
+    def memoize_discover(self, key: tuple[str, ...], fn: Callable[[], Any]) -> Any:
+        """Return the memoized discover() result for key, computing it once.
+
+        A None result is memoized too, so a parser that found nothing is not
+        asked again for the same bill. Entries expire after
+        _DISCOVER_MEMO_TTL_SECONDS and the least recently used are evicted
+        beyond _DISCOVER_MEMO_MAX_ENTRIES.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._discover_memo.get(key)
+            if entry is not None:
+                if now - entry[0] < _DISCOVER_MEMO_TTL_SECONDS:
+                    self._discover_memo.move_to_end(key)
+                    return entry[1]
+                del self._discover_memo[key]
+        result = fn()
+        with self._lock:
+            self._discover_memo[key] = (time.monotonic(), result)
+            self._discover_memo.move_to_end(key)
+            while len(self._discover_memo) > _DISCOVER_MEMO_MAX_ENTRIES:
+                self._discover_memo.popitem(last=False)
+        return result
+
+    def clear_discover_memo(self) -> None:
+        with self._lock:
+            self._discover_memo.clear()
 
     # ------------------------------------------------------------------
     # Keyword search (used to detect whether extension data exists)
@@ -23,8 +23,10 @@ import io
 import logging
 import re
 import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Optional, TYPE_CHECKING
+from typing import Iterator, Optional, TYPE_CHECKING
 
 import PyPDF2  # type: ignore
 from docx import Document  # type: ignore
@@ -51,8 +53,14 @@ class _PendingExtraction:
 _PENDING_EXTRACTIONS: dict[str, _PendingExtraction] = {}
 _PENDING_EXTRACTION_LOCK = threading.RLock()
 
+# Text extracted while resolving one bill, keyed by URL; see bill_scope()
+_BILL_TEXTS: ContextVar[Optional[dict[str, str]]] = ContextVar(
+    "_BILL_TEXTS", default=None
+)
+
 # Metrics tracking
 _EXTRACTION_METRICS = {
+    "scope_hits": 0,
     "cache_hits": 0,
     "cache_misses": 0,
     "dedup_waits": 0,
@@ -76,6 +84,23 @@ def reset_extraction_metrics() -> None:
             _EXTRACTION_METRICS[key] = 0
 
 
+@contextmanager
+def bill_scope() -> Iterator[None]:
+    """Share extracted text between parsers until the block exits.
+
+    The summary and votes parsers for a bill often open the same committee
+    PDF. Inside a scope, the first successful extraction of a URL is reused,
+    so the document is downloaded and extracted once even when the persistent
+    document cache is disabled. Worker threads see the scope only if they run
+    in a copy of the caller's context (contextvars.copy_context()).
+    """
+    token = _BILL_TEXTS.set({})
+    try:
+        yield
+    finally:
+        _BILL_TEXTS.reset(token)
+
+
 class DocumentExtractionService:
     """Service for extracting text from documents with caching and
     deduplication.
@@ -93,6 +118,7 @@ class DocumentExtractionService:
         deduplication.
 
         This method:
+        - Reuses text already extracted in the current bill_scope()
         - Checks cache first (both document cache and extracted text cache)
         - Deduplicates concurrent extraction requests for the same URL
         - Automatically caches extracted text for future use
@@ -107,6 +133,24 @@ class DocumentExtractionService:
         Returns:
             Extracted text as string, or None if extraction fails
         """
+        shared = _BILL_TEXTS.get()
+        if shared is not None and url in shared:
+            with _METRICS_LOCK:
+                _EXTRACTION_METRICS["scope_hits"] += 1
+            return shared[url]
+        text = DocumentExtractionService._extract_text(url, cache, config, timeout)
+        if shared is not None and text:
+            shared[url] = text
+        return text
+
+    @staticmethod
+    def _extract_text(
+        url: str,
+        cache: Optional["Cache"],
+        config: Optional["Config"],
+        timeout: int,
+    ) -> Optional[str]:
+        """Extract text without consulting the bill scope."""
         # Step 1: Check extracted text cache first (fastest path)
         if cache and config:
             cached_doc = cache.get_cached_document(url, config)
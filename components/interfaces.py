@@ -480,7 +480,7 @@ class ParserInterface(ABC):
         SUMMARY = "summary"
         VOTES = "votes"
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class DiscoveryResult:
         """Result of the discover() method."""
 
@@ -489,6 +489,19 @@ class ParserInterface(ABC):
         source_url: str
         confidence: float
 
+        # Review dialogs only ever show the top of a document
+        PREVIEW_MAX_CHARS = 4096
+
+        @property
+        def preview_text(self) -> str:
+            """Text to show a reviewer, capped at PREVIEW_MAX_CHARS."""
+            return (self.full_text or self.preview)[: self.PREVIEW_MAX_CHARS]
+
+        @property
+        def effective_confidence(self) -> float:
+            """Parser confidence, or 0.5 if the parser did not report one."""
+            return self.confidence or 0.5
+
     # Mandatory fields for each implementation of this interface:
     parser_type: ParserType
     """Must declare what kind of information this looks for"""
@@ -498,6 +511,8 @@ class ParserInterface(ABC):
     """Relative cost of running this parser (higher = more expensive)"""
     file_format: str
     """File format this parser works with: 'pdf', 'html', or 'docx'"""
+    parse_is_source_only: bool = False
+    """True if parse() only echoes candidate.source_url, so it can be skipped"""
 
     def __init_subclass__(cls, **kwargs):
         """Ensures each subclass sets required class attributes at startup"""
@@ -555,6 +570,22 @@ class ParserInterface(ABC):
         """
         return _fetch_binary(url, timeout, cache, config)
 
+    @classmethod
+    def probe(
+        cls,
+        base_url: str,
+        bill: BillAtHearing,
+        cache: Optional[Any] = None,
+        config: Optional[Any] = None,
+    ) -> Optional[bool]:
+        """Cheaply check whether discover() could find anything.
+
+        Returns False when the parser can rule itself out without fetching or
+        extracting documents, so discover() is skipped. The default None means
+        "can't tell cheaply" and discover() always runs.
+        """
+        return None
+
     @classmethod
     @abstractmethod
     def discover(
@@ -631,15 +662,39 @@ class Config:
         return Config.Runner(self.config)  # type: ignore
 
     @property
-    def review_mode(self) -> bool:
-        """The review mode."""
-        return bool(self.config.get("review_mode", True))
+    def review_mode(self) -> str:
+        """The review mode: "on", "off" or "deferred"."""
+        mode = self.config.get("review_mode", "on")
+        # YAML reads a bare on/off as a boolean
+        if isinstance(mode, bool):
+            return "on" if mode else "off"
+        return str(mode)
 
     @property
     def popup_review(self) -> bool:
         """Whether to use popup review."""
         return bool(self.config.get("popup_review", False))
 
+    @property
+    def concurrent_discovery(self) -> bool:
+        """Whether to run Tier 2 parser discovery concurrently."""
+        return bool(self.config.get("concurrent_discovery", False))
+
+    @property
+    def parallel_discover(self) -> bool:
+        """Whether to run discovery for every parser in the sequence concurrently."""
+        return bool(self.config.get("parallel_discover", False))
+
+    @property
+    def discover_concurrency(self) -> int:
+        """Most discovery calls to run at once for one bill when prefetching."""
+        return max(1, int(self.config.get("discover_concurrency", 4)))
+
+    @property
+    def fast_path_threshold(self) -> int:
+        """Wins a committee's only parser needs before it is trusted; 0 = off."""
+        return max(0, int(self.config.get("fast_path_threshold", 0)))
+
     class DeferredReview:
         """Deferred review configuration."""
 
@@ -662,9 +717,14 @@ class Config:
             return bool(self.deferred_review.get("group_by_bill", False))
 
         @property
-        def auto_accept_high_confidence(self) -> bool:
-            """Whether to auto-accept high confidence parsers."""
-            return bool(self.deferred_review.get("auto_accept_high_confidence", False))
+        def auto_accept_high_confidence(self) -> float:
+            """Confidence at or above which parsers are auto-accepted."""
+            return float(self.deferred_review.get("auto_accept_high_confidence", 0.9))
+
+        @property
+        def llm_cache_ttl_days(self) -> int:
+            """Days to reuse a cached LLM decision before asking again."""
+            return int(self.deferred_review.get("llm_cache_ttl_days", 30))
 
     @property
     def deferred_review(self) -> Config.DeferredReview:
@@ -731,6 +791,22 @@ bill_id: {bill_id}
             """The timeout for the LLM request."""
             return int(self.llm.get("timeout", 120))
 
+        @property
+        def preview_window(self) -> tuple[int, int]:
+            """Head and tail characters of a document kept for LLM checks."""
+            window = self.llm.get("preview_window", {})
+            return int(window.get("head", 800)), int(window.get("tail", 400))
+
+        @property
+        def batch_size(self) -> int:
+            """How many decisions to send in one LLM request (1 = no batching)."""
+            return max(1, int(self.llm.get("batch_size", 1)))
+
+        @property
+        def batch_wait_ms(self) -> int:
+            """How long a decision waits for others to fill a batch."""
+            return int(self.llm.get("batch_wait_ms", 250))
+
     @property
     def llm(self) -> Config.Llm:
         """LLM configuration."""
@@ -7,13 +7,31 @@ without requiring human intervention.
 
 import json
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Optional, Literal
+from typing import Optional, Literal, Sequence
 
 import niquests as requests  # type: ignore
 
 from components.interfaces import Config
 
+logger = logging.getLogger(__name__)
+
+Decision = Optional[Literal["yes", "no", "unsure"]]
+_DECISIONS = frozenset({"yes", "no", "unsure"})
+
+_BATCH_INSTRUCTIONS = """
+The rules above apply to each numbered document below, using that
+document's own bill_id and doc_type. Ignore the single-word output rule.
+Instead respond with only a JSON array with one object per document, e.g.
+[{{"id": 0, "decision": "yes"}}, {{"id": 1, "decision": "unsure"}}]
+where each decision is exactly "yes", "no", or "unsure".
+
+{documents}"""
+
 
 class LLMParser:
     """LLM-based parser for document confirmation decisions."""
@@ -173,6 +191,85 @@ class LLMParser:
             )
             return None
 
+    def make_decisions(
+        self, items: Sequence[tuple[str, str, str]]
+    ) -> list[Decision]:
+        """
+        Ask the LLM about several documents in a single request.
+
+        Args:
+            items: (content, doc_type, bill_id) per document
+
+        Returns:
+            One decision per request, in order. Documents the model didn't
+            answer for, or all of them if the reply isn't valid JSON, are asked
+            about individually via make_decision().
+        """
+        if len(items) == 1:
+            return [self.make_decision(*items[0])]
+        if not self.config.llm.enabled or not self.is_available():
+            return [self.make_decision(*request) for request in items]
+        limited = [self._truncate_content(content) for content, _, _ in items]
+        documents = "\n".join(
+            f'{i}. bill_id: {bill_id}, doc_type: {doc_type}, content: """{text}"""'
+            for i, ((_, doc_type, bill_id), text) in enumerate(zip(items, limited))
+        )
+        formatted_prompt = self.config.llm.prompt.format(
+            content="(see numbered documents)",
+            doc_type="(see numbered documents)",
+            bill_id="(each document's bill_id)",
+        ) + _BATCH_INSTRUCTIONS.format(documents=documents)
+        answers: dict[int, str] = {}
+        raw_response = ""
+        try:
+            response = requests.post(
+                f"{self.base_url}/api/generate",
+                json={
+                    "model": self.config.llm.model,
+                    "prompt": formatted_prompt,
+                    "stream": False,
+                    "options": {"temperature": 0.1, "top_p": 0.9},
+                },
+                timeout=self.config.llm.timeout,
+            )
+            if response.status_code == 200:
+                raw_response = response.json().get("response", "").strip()
+                answers = self._parse_batch_response(raw_response)
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            logger.debug("Batched LLM request failed: %s", e)
+        decisions: list[Decision] = []
+        for i, (content, doc_type, bill_id) in enumerate(items):
+            if i not in answers:
+                decisions.append(self.make_decision(content, doc_type, bill_id))
+                continue
+            decision = answers[i]
+            self._log_audit_entry(
+                content, doc_type, bill_id, decision, raw_response, limited[i]
+            )
+            decisions.append(decision)  # type: ignore
+        return decisions
+
+    @staticmethod
+    def _parse_batch_response(response_text: str) -> dict[int, str]:
+        """Map document ids to decisions from a batched JSON reply."""
+        start = response_text.find("[")
+        end = response_text.rfind("]")
+        if start < 0 or end < start:
+            return {}
+        try:
+            entries = json.loads(response_text[start : end + 1])
+        except json.JSONDecodeError:
+            return {}
+        answers = {}
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            decision = str(entry.get("decision", "")).strip().lower()
+            if isinstance(entry.get("id"), int) and decision in _DECISIONS:
+                answers[entry["id"]] = decision
+        return answers
+
     def _truncate_content(self, content: str) -> str:
         """
         Aggressively truncate content to prevent LLM timeouts.
@@ -278,3 +375,83 @@ class LLMParser:
             )
         # Log as JSON for easy parsing
         self.audit_logger.info(json.dumps(audit_entry, ensure_ascii=False))
+
+
+class BatchLLMDecider:
+    """Coalesces decisions from concurrent callers into batched LLM requests.
+
+    Bills are resolved on worker threads, so decisions arrive from many
+    threads at once. Callers enqueue a request and get a Future; a single
+    background thread takes the first queued request, waits up to max_wait
+    seconds for batch_size to fill, and sends the batch. Requests that arrive
+    while a batch is in flight are picked up by the next one.
+    """
+
+    def __init__(self, parser: LLMParser, batch_size: int, max_wait: float) -> None:
+        self._parser = parser
+        self._batch_size = max(1, batch_size)
+        self._max_wait = max_wait
+        self._queue: queue.SimpleQueue[
+            tuple[tuple[str, str, str], Future[Decision]]
+        ] = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    def submit(self, content: str, doc_type: str, bill_id: str) -> Future[Decision]:
+        """Queue a decision without waiting for it."""
+        future: Future[Decision] = Future()
+        self._queue.put(((content, doc_type, bill_id), future))
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._drain, name="llm-batcher", daemon=True
+                )
+                self._worker.start()
+        return future
+
+    def decide(self, content: str, doc_type: str, bill_id: str) -> Decision:
+        """Queue a decision and wait for the batch carrying it."""
+        return self.submit(content, doc_type, bill_id).result()
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._run(batch)
+
+    def _run(self, batch: list[tuple[tuple[str, str, str], Future[Decision]]]) -> None:
+        try:
+            decisions = self._parser.make_decisions([request for request, _ in batch])
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            # Same as an unavailable LLM; the batcher thread must keep running
+            logger.debug("Batched LLM decision failed: %s", e)
+            decisions = [None] * len(batch)
+        for (_, future), decision in zip(batch, decisions):
+            future.set_result(decision)
+
+
+_BATCH_DECIDERS: dict[tuple[str, str, int], BatchLLMDecider] = {}
+_BATCH_DECIDERS_LOCK = threading.Lock()
+
+
+def get_batch_decider(config: Config) -> BatchLLMDecider:
+    """Shared decider for the configured LLM endpoint, model and batch size."""
+    llm = config.llm
+    key = (f"{llm.host}:{llm.port}", llm.model, llm.batch_size)
+    with _BATCH_DECIDERS_LOCK:
+        decider = _BATCH_DECIDERS.get(key)
+        if decider is None:
+            decider = BatchLLMDecider(
+                LLMParser(config), llm.batch_size, llm.batch_wait_ms / 1000
+            )
+            _BATCH_DECIDERS[key] = decider
+        return decider
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from threading import Lock
-from typing import Optional, TYPE_CHECKING, Any
+from typing import Optional, TYPE_CHECKING, Any, Sequence
 import uuid
 
 if TYPE_CHECKING:
@@ -256,7 +256,7 @@ class CommitteeContact:  # pylint: disable=too-many-instance-attributes
     house_vice_chair_email: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeferredConfirmation:
     """Represents a parser confirmation that needs review."""
 
@@ -296,6 +296,11 @@ class DeferredReviewSession:
         with self._lock:
             self.confirmations.append(confirmation)
 
+    def add_confirmations(self, confirmations: Sequence[DeferredConfirmation]) -> None:
+        """Add several confirmations under one lock acquisition (thread-safe)."""
+        with self._lock:
+            self.confirmations.extend(confirmations)
+
     def get_summary_count(self) -> int:
         """Get count of summary confirmations."""
         return len([c for c in self.confirmations if c.parser_type == "summary"])
@@ -1,10 +1,21 @@
 """Pipeline for resolving the summary for a bill."""
 
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import copy_context
+from dataclasses import dataclass
 from enum import IntEnum
+import hashlib
 import logging
-from typing import Optional
+import sys
+import threading
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, TypeVar
 
+from components.extraction import bill_scope
 from components.interfaces import ParserInterface, Config
+from components.llm import get_batch_decider
 from components.models import (
     BillAtHearing,
     SummaryInfo,
@@ -37,6 +48,13 @@ from parsers.votes_accompanied_bill import VotesAccompaniedBillParser
 
 logger = logging.getLogger(__name__)
 
+_InfoT = TypeVar("_InfoT", SummaryInfo, VoteInfo)
+
+_SUMMARY = ParserInterface.ParserType.SUMMARY
+_VOTES = ParserInterface.ParserType.VOTES
+_PT_SUMMARY: str = _SUMMARY.value
+_PT_VOTES: str = _VOTES.value
+
 
 class ParserTier(IntEnum):
     """Parser priority tiers for intelligent selection."""
@@ -46,32 +64,101 @@ class ParserTier(IntEnum):
     COST_FALLBACK = 2  # Trying parsers by cost (no committee history)
 
 
-# Maps the cache module name to the actual module object
+@dataclass(frozen=True, slots=True)
+class PipelineConfig:
+    """Snapshot of the Config values the resolvers read per candidate.
+
+    Config properties build wrapper objects on every access, so callers that
+    resolve many bills should build this once per run and pass it in.
+    """
+
+    review_mode: str  # mirrors Config.review_mode
+    auto_accept_threshold: float
+    concurrent_discovery: bool
+    parallel_discover: bool
+    discover_concurrency: int = 4
+    llm_cache_ttl_days: int = 30
+    fast_path_threshold: int = 0
+
+    @classmethod
+    def from_config(cls, cfg: Config) -> PipelineConfig:
+        return cls(
+            review_mode=cfg.review_mode,
+            auto_accept_threshold=cfg.deferred_review.auto_accept_high_confidence,
+            concurrent_discovery=cfg.concurrent_discovery,
+            parallel_discover=cfg.parallel_discover,
+            discover_concurrency=cfg.discover_concurrency,
+            llm_cache_ttl_days=cfg.deferred_review.llm_cache_ttl_days,
+            fast_path_threshold=cfg.fast_path_threshold,
+        )
+
+
+# Enum members are singletons; bind them so hot paths can compare with `is`
+_TIER_CACHED = ParserTier.BILL_CACHED
+_TIER_COMMITTEE = ParserTier.COMMITTEE_PROVEN
+_TIER_FALLBACK = ParserTier.COST_FALLBACK
+
+
+# Every parser, in priority order within each type
+_PARSERS: tuple[type[ParserInterface], ...] = (
+    SummaryBillTabTextParser,
+    SummaryAccompaniedCommitteeParser,
+    SummaryCommitteePdfParser,
+    SummaryHearingDocsPdfParser,
+    SummaryHearingPdfParser,
+    SummaryHearingDocsPdfContentParser,
+    SummaryCommitteeDocxParser,
+    SummaryHearingDocsDocxParser,
+    VotesBillEmbeddedParser,
+    VotesBillPdfParser,
+    VotesCommitteeDocumentsParser,
+    VotesDocxParser,
+    VotesHearingCommitteeDocumentsParser,
+    VotesJournalPdfParser,
+    VotesAccompaniedBillParser,
+)
+# Maps (parser type, cache module name) to the parser class. Module names are
+# interned, as are the ones CacheDB hands back for confirmed entries.
+PARSER_REGISTRY: dict[tuple[str, str], type[ParserInterface]] = {
+    (parser.parser_type.value, sys.intern(parser.__module__)): parser
+    for parser in _PARSERS
+}
+# parser_type.value per module, so hot paths skip the Enum .value descriptor
+_TYPE_BY_MODULE: dict[str, str] = {
+    modname: ptype for ptype, modname in PARSER_REGISTRY
+}
+PARSERS_BY_TYPE: dict[str, tuple[type[ParserInterface], ...]] = {
+    parser_type.value: tuple(p for p in _PARSERS if p.parser_type is parser_type)
+    for parser_type in ParserInterface.ParserType
+}
+# Per-type views keyed by module name alone, for the resolvers' hot path
 SUMMARY_REGISTRY: dict[str, type[ParserInterface]] = {
-    module.__module__: module
-    for module in [  # type: ignore
-        SummaryBillTabTextParser,
-        SummaryAccompaniedCommitteeParser,
-        SummaryCommitteePdfParser,
-        SummaryHearingDocsPdfParser,
-        SummaryHearingPdfParser,
-        SummaryHearingDocsPdfContentParser,
-        SummaryCommitteeDocxParser,
-        SummaryHearingDocsDocxParser,
-    ]
+    modname: parser
+    for (ptype, modname), parser in PARSER_REGISTRY.items()
+    if ptype == _PT_SUMMARY
 }
 VOTES_REGISTRY: dict[str, type[ParserInterface]] = {
-    module.__module__: module
-    for module in [  # type: ignore
-        VotesBillEmbeddedParser,
-        VotesBillPdfParser,
-        VotesCommitteeDocumentsParser,
-        VotesDocxParser,
-        VotesHearingCommitteeDocumentsParser,
-        VotesJournalPdfParser,
-        VotesAccompaniedBillParser,
-    ]
+    modname: parser
+    for (ptype, modname), parser in PARSER_REGISTRY.items()
+    if ptype == _PT_VOTES
+}
+# One bit per registered parser, used to dedup the tiered sequence per bill.
+_SUMMARY_BITS: dict[str, int] = {
+    modname: 1 << i for i, modname in enumerate(SUMMARY_REGISTRY)
 }
+_VOTES_BITS: dict[str, int] = {
+    modname: 1 << i for i, modname in enumerate(VOTES_REGISTRY)
+}
+# Tier 2 fallback order is invariant, so sort once at import rather than per bill.
+# Each entry is (parser, module_name, bit) to skip per-bill lookups in the loop.
+_SUMMARY_BY_COST: tuple[tuple[type[ParserInterface], str, int], ...] = tuple(
+    (parser, modname, _SUMMARY_BITS[modname])
+    for modname, parser in sorted(SUMMARY_REGISTRY.items(), key=lambda kv: kv[1].cost)
+)
+_VOTES_BY_COST: tuple[tuple[type[ParserInterface], str, int], ...] = tuple(
+    (parser, modname, _VOTES_BITS[modname])
+    for modname, parser in sorted(VOTES_REGISTRY.items(), key=lambda kv: kv[1].cost)
+)
 
 
 def _detect_vote_committee(full_text: str) -> Optional[str]:
@@ -136,25 +223,38 @@ def should_use_llm_for_parser(
         True if we should consult LLM, False to skip
     """
     # Get parser's confidence (default 0.5 if not specified)
-    parser_conf = candidate.confidence if candidate.confidence else 0.5
+    parser_conf = candidate.effective_confidence
+    if tier is not _TIER_COMMITTEE:
+        return should_consult_llm(tier, parser_conf, 0, 0)
+    parser_stats = cache.get_parser_stats(committee_id, parser_type, parser_module)
+    if not parser_stats:
+        # No stats? Use LLM (shouldn't happen in tier 1, but be safe)
+        return True
+    return should_consult_llm(
+        tier,
+        parser_conf,
+        parser_stats.get("current_streak", 0),
+        parser_stats.get("count", 0),
+    )
 
+
+def should_consult_llm(
+    tier: ParserTier, parser_conf: float, streak: int, count: int
+) -> bool:
+    """Pure form of the LLM gate over primitives; see should_use_llm_for_parser.
+
+    streak and count are the committee's stats for the parser and are only
+    consulted for Tier 1.
+    """
     # Tier 0: Bill-specific cache - very high trust
     # Only validate if parser is very suspicious (< 0.3)
-    if tier == ParserTier.BILL_CACHED:
+    if tier is _TIER_CACHED:
         return parser_conf < 0.3
-
     # Tier 2: Cost fallback - no committee proof, always use LLM
-    if tier == ParserTier.COST_FALLBACK:
+    if tier is _TIER_FALLBACK:
         return True
-
     # Tier 1: Committee-proven - phase-based with confidence gate
-    if tier == ParserTier.COMMITTEE_PROVEN:
-        parser_stats = cache.get_committee_parser_stats(committee_id, parser_type, parser_module)
-        if not parser_stats:
-            # No stats? Use LLM (shouldn't happen in tier 1, but be safe)
-            return True
-        streak = parser_stats.get("current_streak", 0)
-        count = parser_stats.get("count", 0)
+    if tier is _TIER_COMMITTEE:
         # Check if pattern is established
         pattern_established = streak >= 3 and count >= 5
         if pattern_established:
@@ -167,221 +267,705 @@ def should_use_llm_for_parser(
     return True
 
 
+def _discover(
+    parser: type[ParserInterface],
+    modname: str,
+    base_url: str,
+    row: BillAtHearing,
+    cache: Cache,
+    cfg: Config,
+) -> Optional[ParserInterface.DiscoveryResult]:
+    """Run parser.discover() once per (parser, bill, committee, hearing) per run.
+
+    Each real call is counted towards the parser's hit rate, which orders
+    the Tier 2 fallback (see _tier2_order). A parser whose cheap probe() rules
+    it out is counted as a miss without running discover(), as is one whose
+    probe() or discover() raises.
+    """
+
+    def run() -> Optional[ParserInterface.DiscoveryResult]:
+        try:
+            if parser.probe(base_url, row, cache, cfg) is False:
+                candidate = None
+            else:
+                candidate = parser.discover(base_url, row, cache, cfg)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Counted as a miss, so a flaky parser sinks in the Tier 2 order
+            logger.warning("discover failed for %s on %s: %s", modname, row.bill_id, e)
+            candidate = None
+        cache.record_discover_attempt(
+            _TYPE_BY_MODULE.get(modname) or parser.parser_type.value,
+            modname,
+            candidate is not None,
+        )
+        return candidate
+
+    key = (modname, row.bill_id, row.committee_id, row.hearing_id or "")
+    return cache.memoize_discover(key, run)
+
+
+def _parse(
+    parser: type[ParserInterface],
+    modname: str,
+    base_url: str,
+    candidate: ParserInterface.DiscoveryResult,
+) -> Optional[dict[str, Any]]:
+    """Run parser.parse(), or None if it raised so the caller can move on."""
+    if parser.parse_is_source_only:
+        return {"source_url": candidate.source_url}
+    try:
+        return parser.parse(base_url, candidate)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.warning("parse failed for %s: %s", modname, e)
+        return None
+
+
+@contextmanager
+def _prefetch_discovery(
+    parser_sequence: Iterable[tuple[type[ParserInterface], ParserTier, str]],
+    base_url: str,
+    row: BillAtHearing,
+    cache: Cache,
+    cfg: Config,
+    pcfg: PipelineConfig,
+) -> Iterator[
+    Callable[[type[ParserInterface], str], Optional[ParserInterface.DiscoveryResult]]
+]:
+    """Yield a discover function, prefetching candidates concurrently when enabled.
+
+    With parallel_discover every parser in the sequence is fanned out; with
+    concurrent_discovery only Tier 2 is, since Tier 0/1 usually hit. Results
+    are still consumed in sequence order, so the chosen parser is the same as
+    with serial discovery; only the waiting overlaps. On exit, prefetches not
+    yet started are cancelled and running ones are waited for, so none record
+    stats or cache entries after the bill is resolved. At most
+    discover_concurrency run at once.
+
+    parser_sequence is only read when prefetching is enabled, in which case
+    it must be a list; otherwise it may be a lazy iterator.
+    """
+    if pcfg.parallel_discover:
+        prefetch = [(parser, modname) for parser, _, modname in parser_sequence]
+    elif pcfg.concurrent_discovery:
+        prefetch = [
+            (parser, modname)
+            for parser, tier, modname in parser_sequence
+            if tier is _TIER_FALLBACK
+        ]
+    else:
+        prefetch = []
+    if len(prefetch) < 2 or pcfg.discover_concurrency < 2:
+        yield lambda parser, modname: _discover(
+            parser, modname, base_url, row, cache, cfg
+        )
+        return
+    pool = ThreadPoolExecutor(
+        max_workers=min(pcfg.discover_concurrency, len(prefetch)),
+        thread_name_prefix="discover",
+    )
+    # Each worker runs in a copy of this context so it shares the bill_scope()
+    futures: dict[str, Future] = {
+        modname: pool.submit(
+            copy_context().run, _discover, parser, modname, base_url, row, cache, cfg
+        )
+        for parser, modname in prefetch
+    }
+
+    def discover(
+        parser: type[ParserInterface], modname: str
+    ) -> Optional[ParserInterface.DiscoveryResult]:
+        future = futures.get(modname)
+        if future is None:
+            return _discover(parser, modname, base_url, row, cache, cfg)
+        return future.result()
+
+    try:
+        yield discover
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _url_hash(url: str) -> str:
+    return hashlib.blake2b((url or "").encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _llm_decision_key(content: str, doc_type: str, bill_id: str, model: str) -> str:
+    """Stable cache key for an LLM decision over the given prompt inputs."""
+    payload = "\x1f".join((content, doc_type, bill_id, model)).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+_LLM_PASSES = {
+    "preview": 0,  # first-pass decisions made on the short preview
+    "full_text": 0,  # second-pass decisions escalated to the full text
+}
+_LLM_PASSES_LOCK = threading.Lock()
+
+
+_CACHE_HITS = {
+    "summary": 0,  # bills answered from a confirmed cached result
+    "votes": 0,
+}
+_FAST_PATH_HITS = {
+    "summary": 0,  # bills answered by a committee's trusted parser alone
+    "votes": 0,
+}
+_CACHE_HITS_LOCK = threading.Lock()
+
+
+def get_cache_hit_counts() -> dict[str, int]:
+    """Get how many resolutions per parser type came straight from the cache."""
+    with _CACHE_HITS_LOCK:
+        return _CACHE_HITS.copy()
+
+
+def get_fast_path_hit_counts() -> dict[str, int]:
+    """Get how many resolutions per parser type took the trusted-parser path."""
+    with _CACHE_HITS_LOCK:
+        return _FAST_PATH_HITS.copy()
+
+
+def get_llm_pass_counts() -> dict[str, int]:
+    """Get how many LLM decisions used the preview vs. the full text."""
+    with _LLM_PASSES_LOCK:
+        return _LLM_PASSES.copy()
+
+
+def _query_llm(
+    content: str, bill_id: str, doc_type: str, config: Config
+) -> Optional[str]:
+    """Ask the LLM directly, or via the shared batcher when batching is on."""
+    if config.llm.enabled and config.llm.batch_size > 1:
+        return get_batch_decider(config).decide(content, doc_type, bill_id)
+    return ask_llm_decision(content, doc_type, bill_id, config)
+
+
+def _ask_llm(
+    content: str,
+    bill_id: str,
+    doc_type: str,
+    config: Config,
+    cache: Optional[Cache],
+) -> Optional[str]:
+    if cache is None or not config.llm.enabled:
+        return _query_llm(content, bill_id, doc_type, config)
+    key = _llm_decision_key(content, doc_type, bill_id, config.llm.model)
+    cached = cache.get_llm_decision(key, config.deferred_review.llm_cache_ttl_days)
+    if cached is not None:
+        logger.debug("Reusing cached LLM decision for %s %s", doc_type, bill_id)
+        return cached
+    decision = _query_llm(content, bill_id, doc_type, config)
+    # "unsure" may be escalated to the full text, so only verdicts are kept.
+    if decision in ("yes", "no"):
+        cache.set_llm_decision(key, decision)
+    return decision
+
+
+def _compact_preview(text: str, head: int = 800, tail: int = 400) -> str:
+    """Keep the start and end of long documents; the middle rarely decides."""
+    if len(text) <= head + tail:
+        return text
+    return text[:head] + "\n…\n" + (text[-tail:] if tail else "")
+
+
 def try_llm_decision(
     candidate: ParserInterface.DiscoveryResult,
     bill_id: str,
     doc_type: str,
     config: Config,
+    cache: Optional[Cache] = None,
 ) -> Optional[str]:
     """
     Try to get an LLM decision for a candidate.
 
+    The short preview is asked about first; only an "unsure" answer is
+    escalated to the full text, when there is one. When a cache is given,
+    decisions are persisted keyed by a hash of the text, doc type, bill and
+    model, so reruns over unchanged documents don't query the LLM again.
+    Long texts are cut to the llm.preview_window head and tail first.
+
     Returns:
         "yes", "no", "unsure", or None if LLM is disabled/unavailable
     """
-    preview_text = candidate.full_text if candidate.full_text else candidate.preview
-    return ask_llm_decision(preview_text, doc_type, bill_id, config)
+    head, tail = config.llm.preview_window
+    first_text = _compact_preview(candidate.preview or candidate.full_text, head, tail)
+    decision = _ask_llm(first_text, bill_id, doc_type, config, cache)
+    with _LLM_PASSES_LOCK:
+        _LLM_PASSES["preview"] += 1
+    if decision != "unsure" or not candidate.full_text:
+        return decision
+    full_text = _compact_preview(candidate.full_text, head, tail)
+    if full_text != first_text:
+        logger.debug("Escalating %s %s to full-text LLM check", doc_type, bill_id)
+        decision = _ask_llm(full_text, bill_id, doc_type, config, cache)
+        with _LLM_PASSES_LOCK:
+            _LLM_PASSES["full_text"] += 1
+    return decision
 
 
-def resolve_summary_for_bill(
-    base_url: str,
+@dataclass(frozen=True, slots=True)
+class _DocSpec(Generic[_InfoT]):
+    """Everything that differs between the summary and votes pipelines."""
+
+    parser_type: str
+    registry: dict[str, type[ParserInterface]]
+    bits: dict[str, int]
+    by_cost: tuple[tuple[type[ParserInterface], str, int], ...]
+    result_cls: type[_InfoT]
+    # Votes are cached per (bill, committee) and must be attributed to the
+    # committee under review; summaries are cached per bill.
+    per_committee: bool
+    dialog_title: str
+    dialog_heading: str
+    fallback_prompt: str
+
+
+_SUMMARY_SPEC: _DocSpec[SummaryInfo] = _DocSpec(
+    parser_type=_PT_SUMMARY,
+    registry=SUMMARY_REGISTRY,
+    bits=_SUMMARY_BITS,
+    by_cost=_SUMMARY_BY_COST,
+    result_cls=SummaryInfo,
+    per_committee=False,
+    dialog_title="Confirm summary",
+    dialog_heading="Use this summary for {bill_id}?",
+    fallback_prompt="Use this summary?",
+)
+_VOTES_SPEC: _DocSpec[VoteInfo] = _DocSpec(
+    parser_type=_PT_VOTES,
+    registry=VOTES_REGISTRY,
+    bits=_VOTES_BITS,
+    by_cost=_VOTES_BY_COST,
+    result_cls=VoteInfo,
+    per_committee=True,
+    dialog_title="Confirm vote record",
+    dialog_heading="Use this vote record for {bill_id}?",
+    fallback_prompt="Use this vote source?",
+)
+
+
+def _effective_cost(cost: int, attempts: int, failures: int) -> float:
+    """Scale a parser's static cost by how often its discover() comes up empty."""
+    if not attempts:
+        return float(cost)
+    fail_rate = failures / attempts
+    return cost * (1 + fail_rate) / (2 - fail_rate)
+
+
+def _tier2_order(
+    spec: _DocSpec, cache: Cache
+) -> tuple[tuple[type[ParserInterface], str, int], ...]:
+    """Tier 2 parsers ordered by observed effective cost, static cost on ties."""
+    stats = cache.get_discover_stats(spec.parser_type)
+    if not stats:
+        return spec.by_cost
+    return tuple(
+        sorted(
+            spec.by_cost,
+            key=lambda entry: _effective_cost(
+                entry[0].cost, *stats.get(entry[1], (0, 0))
+            ),
+        )
+    )
+
+
+def _get_confirmed_entry(
+    spec: _DocSpec, cache: Cache, row: BillAtHearing
+) -> tuple[Optional[str], Optional[dict]]:
+    """(module, result) for the bill's confirmed parser, else (None, None)."""
+    if spec.per_committee:
+        return cache.get_confirmed_votes_entry(row.bill_id, row.committee_id)
+    return cache.get_confirmed_entry(row.bill_id, spec.parser_type)
+
+
+def _get_parser(spec: _DocSpec, cache: Cache, row: BillAtHearing) -> Optional[str]:
+    if spec.per_committee:
+        return cache.get_votes_parser(row.bill_id, row.committee_id)
+    return cache.get_parser(row.bill_id, spec.parser_type)
+
+
+def _decide_deferred(
+    spec: _DocSpec,
     cfg: Config,
     cache: Cache,
     row: BillAtHearing,
-    deferred_session: Optional[DeferredReviewSession] = None,
-) -> SummaryInfo:
-    """Resolve the summary for a bill."""
-    cached_result = cache.get_result(
-        row.bill_id, ParserInterface.ParserType.SUMMARY.value
+    candidate: ParserInterface.DiscoveryResult,
+    modname: str,
+    tier: ParserTier,
+    seen_llm_decisions: dict[tuple[str, str], Optional[str]],
+    pending_confirmations: list[DeferredConfirmation],
+    pcfg: PipelineConfig,
+) -> tuple[bool, bool]:
+    """Deferred mode: maybe consult the LLM, else queue for batch review."""
+    # Auto-accept confidence settles it; don't spend an LLM call on it
+    confidence = candidate.effective_confidence
+    if confidence >= pcfg.auto_accept_threshold:
+        return True, False
+    # Decide if we should consult LLM based on pattern confidence
+    should_use_llm = should_use_llm_for_parser(
+        modname,
+        row.committee_id,
+        spec.parser_type,
+        cache,
+        tier,
+        candidate,
     )
-    if cached_result and cache.is_confirmed(
-        row.bill_id, ParserInterface.ParserType.SUMMARY.value
+    if not should_use_llm:
+        # Pattern confidence is high - trust it without LLM
+        return True, False
+    # Pattern not established or parser is suspicious - use LLM
+    # A "no" for this parser's document on an earlier run still stands
+    url_hash = _url_hash(candidate.source_url)
+    if cache.is_llm_rejected(
+        row.bill_id,
+        spec.parser_type,
+        modname,
+        url_hash,
+        pcfg.llm_cache_ttl_days,
     ):
-        logger.debug("Found summary in cache; skipping summary search...")
-        return SummaryInfo.from_dict(cached_result)
-    # 1) If we have a confirmed parser, run it silently and return.
-    summary_has_parser: Optional[str] = cache.get_parser(
-        row.bill_id, ParserInterface.ParserType.SUMMARY.value
+        return False, False
+    # Parsers often surface the same document; ask about it once
+    llm_key = (candidate.preview, candidate.full_text)
+    if llm_key in seen_llm_decisions:
+        llm_decision = seen_llm_decisions[llm_key]
+    else:
+        llm_decision = try_llm_decision(
+            candidate,
+            row.bill_id,
+            spec.parser_type,
+            cfg,
+            cache,
+        )
+        seen_llm_decisions[llm_key] = llm_decision
+    if llm_decision == "yes":
+        # LLM confidently accepts
+        return True, False
+    if llm_decision == "no":
+        # LLM confidently rejects - skip this parser, now and on later runs
+        cache.record_llm_rejection(row.bill_id, spec.parser_type, modname, url_hash)
+        return False, False
+    # LLM returned "unsure" or is unavailable; below the auto-accept
+    # threshold, so add to deferred session for later review
+    confirmation = DeferredConfirmation(
+        confirmation_id="",  # Will be auto-generated
+        bill_id=row.bill_id,
+        parser_type=spec.parser_type,
+        parser_module=modname,
+        candidate=candidate,
+        preview_text=candidate.preview_text,
+        confidence=confidence,
     )
-    if summary_has_parser and cache.is_confirmed(
-        row.bill_id, ParserInterface.ParserType.SUMMARY.value
-    ):
-        mod = SUMMARY_REGISTRY[summary_has_parser]
-        candidate: Optional[ParserInterface.DiscoveryResult] = mod.discover(
-            base_url, row, cache, cfg
+    pending_confirmations.append(confirmation)
+    return True, True  # Tentatively accept for now
+
+
+def _decide_on(  # pylint: disable=unused-argument
+    spec: _DocSpec,
+    cfg: Config,
+    cache: Cache,
+    row: BillAtHearing,
+    candidate: ParserInterface.DiscoveryResult,
+    modname: str,
+    tier: ParserTier,
+    seen_llm_decisions: dict[tuple[str, str], Optional[str]],
+    pending_confirmations: list[DeferredConfirmation],
+    pcfg: PipelineConfig,
+) -> tuple[bool, bool]:
+    """Interactive mode: show a dialog, since the parser isn't confirmed yet."""
+    # Use full_text if available, otherwise fall back to preview
+    preview_text = candidate.preview_text
+    if len(preview_text) > 140:
+        accepted = ask_yes_no_with_preview_and_llm_fallback(
+            title=spec.dialog_title,
+            heading=spec.dialog_heading.format(bill_id=row.bill_id),
+            preview_text=preview_text,
+            url=candidate.source_url,
+            doc_type=spec.parser_type,
+            bill_id=row.bill_id,
+            config=cfg,
         )
-        if candidate:
-            parsed: dict = mod.parse(base_url, candidate)
-            result = SummaryInfo(
-                present=True,
-                location=mod.location,
-                source_url=candidate.source_url,
-                parser_module=summary_has_parser,
-                needs_review=False,
-            )
-            cache.set_result(
-                row.bill_id,
-                ParserInterface.ParserType.SUMMARY.value,
-                summary_has_parser,
-                result.to_dict(),
-                confirmed=True,
-            )
-            # Record success for committee-level learning
-            cache.record_committee_parser(
-                row.committee_id,
-                ParserInterface.ParserType.SUMMARY.value,
-                summary_has_parser,
-            )
-            return result
-        # If the source vanished, fall through to normal sequence.
-    # 2) Build parser sequence with committee-aware prioritization
-    all_parsers: list[type[ParserInterface]] = [
-        parser
-        for parser in SUMMARY_REGISTRY.values()
-        if parser.parser_type == ParserInterface.ParserType.SUMMARY
-    ]
-    # Sort by cost (ascending) - cheaper parsers first
-    all_parsers.sort(key=lambda p: p.cost)
-    # Build tiered priority list with tier tracking
-    # Each entry is (parser, tier, module_name)
-    parser_sequence: list[tuple[type[ParserInterface], ParserTier, str]] = []
-    added_parsers = set()
+    else:
+        accepted = ask_yes_no_with_llm_fallback(
+            preview_text or spec.fallback_prompt,
+            candidate.source_url,
+            doc_type=spec.parser_type,
+            bill_id=row.bill_id,
+            config=cfg,
+        )
+    return accepted, False
+
+
+def _decide_off(  # pylint: disable=unused-argument
+    spec: _DocSpec,
+    cfg: Config,
+    cache: Cache,
+    row: BillAtHearing,
+    candidate: ParserInterface.DiscoveryResult,
+    modname: str,
+    tier: ParserTier,
+    seen_llm_decisions: dict[tuple[str, str], Optional[str]],
+    pending_confirmations: list[DeferredConfirmation],
+    pcfg: PipelineConfig,
+) -> tuple[bool, bool]:
+    """Headless mode: auto-accept, but not "confirmed"."""
+    return True, True
+
+
+_Decider = Callable[..., tuple[bool, bool]]
+
+# Each decider returns (accepted, needs_review) for a candidate reached via
+# an unconfirmed cache entry or a new parser
+_DECIDERS: dict[str, _Decider] = {
+    "deferred": _decide_deferred,
+    "on": _decide_on,
+    "off": _decide_off,
+}
+
+
+def _select_decider(
+    pcfg: PipelineConfig, deferred_session: Optional[DeferredReviewSession]
+) -> _Decider:
+    """Pick the acceptance policy once per resolver call."""
+    if pcfg.review_mode == "deferred" and deferred_session is None:
+        return _decide_off
+    return _DECIDERS.get(pcfg.review_mode, _decide_off)
+
+
+def _iter_parser_sequence(
+    spec: _DocSpec,
+    cache: Cache,
+    row: BillAtHearing,
+    has_parser: Optional[str],
+) -> Iterator[tuple[type[ParserInterface], ParserTier, str]]:
+    """Yield the parsers to try as (parser, tier, module_name), tier by tier.
+
+    Each parser appears once, at its highest tier; within a tier, the order
+    the modules are listed is kept. A tier is only looked up once the one
+    before it is used up, so a Tier 0/1 hit never orders Tier 2.
+    """
+    added_mask = 0
+
+    def fresh(module_name: str) -> bool:
+        nonlocal added_mask
+        bit = spec.bits.get(module_name, 0)
+        if not bit or added_mask & bit:
+            return False
+        added_mask |= bit
+        return True
+
     # Tier 0: Bill-specific cache
-    if summary_has_parser and summary_has_parser in SUMMARY_REGISTRY:
-        parser = SUMMARY_REGISTRY[summary_has_parser]
-        parser_sequence.append((parser, ParserTier.BILL_CACHED, summary_has_parser))
-        added_parsers.add(parser)
+    if has_parser and fresh(has_parser):
+        yield spec.registry[has_parser], _TIER_CACHED, has_parser
     # Tier 1: Committee-proven parsers
-    committee_parsers = cache.get_committee_parsers(
-        row.committee_id, ParserInterface.ParserType.SUMMARY.value
+    for module_name in cache.get_committee_parsers(
+        row.committee_id, spec.parser_type
+    ):
+        if fresh(module_name):
+            yield spec.registry[module_name], _TIER_COMMITTEE, module_name
+    # Tier 2: Remaining parsers by observed effective cost
+    for parser, module_name, _ in _tier2_order(spec, cache):
+        if fresh(module_name):
+            yield parser, _TIER_FALLBACK, module_name
+
+
+def _build_parser_sequence(
+    spec: _DocSpec,
+    cache: Cache,
+    row: BillAtHearing,
+    has_parser: Optional[str],
+) -> list[tuple[type[ParserInterface], ParserTier, str]]:
+    """The whole parser sequence up front, for callers that prefetch it."""
+    return list(_iter_parser_sequence(spec, cache, row, has_parser))
+
+
+def _try_trusted_parser(
+    spec: _DocSpec[_InfoT],
+    base_url: str,
+    cfg: Config,
+    cache: Cache,
+    row: BillAtHearing,
+    has_parser: Optional[str],
+    pcfg: PipelineConfig,
+    needs_review: bool,
+) -> Optional[_InfoT]:
+    """Run a committee's trusted parser alone; None means take the full path.
+
+    A parser is trusted once it is the only one that has ever won for the
+    committee, at least fast_path_threshold times. Its candidate is accepted
+    without an LLM call or a dialog if it clears the auto-accept threshold.
+    No user has seen it, so it is stored unconfirmed in every review mode;
+    needs_review follows the review mode, as in the main loop.
+    """
+    modname = cache.get_trusted_committee_parser(
+        row.committee_id, spec.parser_type, pcfg.fast_path_threshold
+    )
+    if modname is None or (has_parser and has_parser != modname):
+        return None
+    p = spec.registry.get(modname)
+    if p is None:
+        return None
+    candidate = _discover(p, modname, base_url, row, cache, cfg)
+    if not candidate or candidate.effective_confidence < pcfg.auto_accept_threshold:
+        return None
+    if spec.per_committee and not _passes_committee_attribution(
+        candidate.full_text or "", row.committee_id
+    ):
+        return None
+    parsed = _parse(p, modname, base_url, candidate)
+    if parsed is None:
+        return None
+    result = spec.result_cls(
+        present=True,
+        location=p.location,
+        source_url=parsed.get("source_url"),
+        parser_module=modname,
+        needs_review=needs_review,
     )
-    for module_name in committee_parsers:
-        if module_name in SUMMARY_REGISTRY:
-            parser = SUMMARY_REGISTRY[module_name]
-            if parser not in added_parsers:
-                parser_sequence.append(
-                    (parser, ParserTier.COMMITTEE_PROVEN, module_name)
+    cache.record_success(
+        row.bill_id,
+        row.committee_id,
+        spec.parser_type,
+        modname,
+        result,
+        confirmed=False,
+    )
+    with _CACHE_HITS_LOCK:
+        _FAST_PATH_HITS[spec.parser_type] += 1
+    return result
+
+
+def _resolve_doc(
+    spec: _DocSpec[_InfoT],
+    base_url: str,
+    cfg: Config,
+    cache: Cache,
+    row: BillAtHearing,
+    deferred_session: Optional[DeferredReviewSession] = None,
+    pipeline_cfg: Optional[PipelineConfig] = None,
+) -> _InfoT:
+    """Shared summary/votes pipeline, specialized by spec."""
+    has_parser, cached_result = _get_confirmed_entry(spec, cache, row)
+    if cached_result:
+        with _CACHE_HITS_LOCK:
+            _CACHE_HITS[spec.parser_type] += 1
+        return spec.result_cls.from_dict(cached_result)
+    # 1) If we have a confirmed parser, run it silently and return.
+    if has_parser:
+        mod = spec.registry[has_parser]
+        candidate: Optional[ParserInterface.DiscoveryResult] = _discover(
+            mod, has_parser, base_url, row, cache, cfg
+        )
+        if candidate:
+            doc_text = candidate.full_text or ""
+            if spec.per_committee and not _passes_committee_attribution(
+                doc_text, row.committee_id
+            ):
+                logger.debug(
+                    "Confirmed-cache vote rejected for %s/%s: different committee",
+                    row.bill_id,
+                    row.committee_id,
                 )
-                added_parsers.add(parser)
-    # Tier 2: Remaining parsers by cost
-    for parser in all_parsers:
-        if parser not in added_parsers:
-            module_name = parser.__module__
-            parser_sequence.append((parser, ParserTier.COST_FALLBACK, module_name))
-            added_parsers.add(parser)
-    for p, tier, modname in parser_sequence:
-        candidate = p.discover(base_url, row, cache, cfg)
-        if not candidate:
-            continue
-        # If we're here via an unconfirmed cache OR a new parser:
-        accepted = True
-        needs_review = False
-        if cfg.review_mode == "deferred" and deferred_session is not None:
-            # Decide if we should consult LLM based on pattern confidence
-            should_use_llm = should_use_llm_for_parser(
-                modname,
-                row.committee_id,
-                ParserInterface.ParserType.SUMMARY.value,
-                cache,
-                tier,
-                candidate,
-            )
-            if should_use_llm:
-                # Pattern not established or parser is suspicious - use LLM
-                llm_decision = try_llm_decision(
-                    candidate,
+            elif _parse(mod, has_parser, base_url, candidate) is not None:
+                result = spec.result_cls(
+                    present=True,
+                    location=mod.location,
+                    source_url=candidate.source_url,
+                    parser_module=has_parser,
+                    needs_review=False,
+                )
+                cache.record_success(
                     row.bill_id,
-                    ParserInterface.ParserType.SUMMARY.value,
-                    cfg,
+                    row.committee_id,
+                    spec.parser_type,
+                    has_parser,
+                    result,
+                    confirmed=True,
                 )
-                if llm_decision == "yes":
-                    # LLM confidently accepts
-                    accepted = True
-                    needs_review = False
-                elif llm_decision == "no":
-                    # LLM confidently rejects - skip this parser
-                    continue
-                else:
-                    # LLM returned "unsure" or is unavailable
-                    # Fall back to confidence threshold logic
-                    preview_text = (
-                        candidate.full_text
-                        if candidate.full_text
-                        else candidate.preview
+                return result
+        # Stale source, attribution mismatch or parse error: fall through to
+        # the normal sequence.
+    else:
+        has_parser = _get_parser(spec, cache, row)
+    # 2) Build parser sequence with committee-aware prioritization
+    pcfg = pipeline_cfg or PipelineConfig.from_config(cfg)
+    decide = _select_decider(pcfg, deferred_session)
+    # Headless runs accept without anyone confirming, trusted parser or not
+    trusted_result = _try_trusted_parser(
+        spec, base_url, cfg, cache, row, has_parser, pcfg, decide is _decide_off
+    )
+    if trusted_result is not None:
+        return trusted_result
+    parser_sequence: Iterable[tuple[type[ParserInterface], ParserTier, str]]
+    if pcfg.parallel_discover or pcfg.concurrent_discovery:
+        parser_sequence = _build_parser_sequence(spec, cache, row, has_parser)
+    else:
+        # Built as it is consumed, so an early hit skips the later tiers
+        parser_sequence = _iter_parser_sequence(spec, cache, row, has_parser)
+    # 3) Try parsers
+    seen_llm_decisions: dict[tuple[str, str], Optional[str]] = {}
+    # Handed to the shared session in one locked call once a result lands
+    pending_confirmations: list[DeferredConfirmation] = []
+    with _prefetch_discovery(
+        parser_sequence, base_url, row, cache, cfg, pcfg
+    ) as discover:
+        for p, tier, modname in parser_sequence:
+            candidate = discover(p, modname)
+            if not candidate:
+                continue
+            if spec.per_committee:
+                doc_text = candidate.full_text or ""
+                if not _passes_committee_attribution(doc_text, row.committee_id):
+                    logger.debug(
+                        "Skipping vote candidate for %s/%s: "
+                        "attributed to different committee",
+                        row.bill_id,
+                        row.committee_id,
                     )
-                    confidence = candidate.confidence if candidate.confidence else 0.5
-                    auto_yes = cfg.deferred_review.auto_accept_high_confidence
-                    if confidence >= auto_yes:
-                        accepted = True
-                        needs_review = False
-                    else:
-                        # Add to deferred session for later review
-                        summary = ParserInterface.ParserType.SUMMARY.value
-                        confirmation = DeferredConfirmation(
-                            confirmation_id="",  # Will be auto-generated
-                            bill_id=row.bill_id,
-                            parser_type=summary,
-                            parser_module=modname,
-                            candidate=candidate,
-                            preview_text=preview_text,
-                            confidence=confidence,
-                        )
-                        deferred_session.add_confirmation(confirmation)
-                        accepted = True  # Tentatively accept for now
-                        needs_review = True
-            else:
-                # Pattern confidence is high - trust it without LLM
-                accepted = True
-                needs_review = False
-        elif cfg.review_mode == "on":
-            # show dialog only when not previously confirmed
-            # Use full_text if available, otherwise fall back to preview
-            preview_text = (
-                candidate.full_text if candidate.full_text else candidate.preview
+                    continue
+            # If we're here via an unconfirmed cache OR a new parser:
+            queued = len(pending_confirmations)
+            accepted, needs_review = decide(
+                spec,
+                cfg,
+                cache,
+                row,
+                candidate,
+                modname,
+                tier,
+                seen_llm_decisions,
+                pending_confirmations,
+                pcfg,
             )
-            if len(preview_text) > 140:
-                accepted = ask_yes_no_with_preview_and_llm_fallback(
-                    title="Confirm summary",
-                    heading=f"Use this summary for {row.bill_id}?",
-                    preview_text=preview_text,
-                    url=candidate.source_url,
-                    doc_type=ParserInterface.ParserType.SUMMARY.value,
-                    bill_id=row.bill_id,
-                    config=cfg,
-                )
-            else:
-                accepted = ask_yes_no_with_llm_fallback(
-                    preview_text or "Use this summary?",
-                    candidate.source_url,
-                    doc_type=ParserInterface.ParserType.SUMMARY.value,
-                    bill_id=row.bill_id,
-                    config=cfg,
-                )
-        else:  # review_mode == "off"
-            needs_review = True
+            if not accepted:
+                continue
 
-        if accepted:
-            parsed = p.parse(base_url, candidate)
-            result = SummaryInfo(
+            parsed = _parse(p, modname, base_url, candidate)
+            if parsed is None:
+                # Drop any confirmation the decider queued for it
+                del pending_confirmations[queued:]
+                continue
+            result = spec.result_cls(
                 present=True,
                 location=p.location,
                 source_url=parsed.get("source_url"),
                 parser_module=modname,
                 needs_review=needs_review,
             )
-            cache.set_result(
+            # Store the result and credit the parser for committee-level
+            # learning in a single transaction
+            cache.record_success(
                 row.bill_id,
-                ParserInterface.ParserType.SUMMARY.value,
+                row.committee_id,
+                spec.parser_type,
                 modname,
-                result.to_dict(),
-                confirmed=cfg.review_mode == "on" and not needs_review,
-            )
-            # Record success for committee-level learning
-            cache.record_committee_parser(
-                row.committee_id, ParserInterface.ParserType.SUMMARY.value, modname
+                result,
+                confirmed=pcfg.review_mode == "on" and not needs_review,
             )
+            if pending_confirmations and deferred_session is not None:
+                deferred_session.add_confirmations(pending_confirmations)
             return result
-    return SummaryInfo(
+    # 4) Nothing landed
+    return spec.result_cls(
         present=False,
         location="unknown",
         source_url=None,
@@ -390,12 +974,27 @@ def resolve_summary_for_bill(
     )
 
 
+def resolve_summary_for_bill(
+    base_url: str,
+    cfg: Config,
+    cache: Cache,
+    row: BillAtHearing,
+    deferred_session: Optional[DeferredReviewSession] = None,
+    pipeline_cfg: Optional[PipelineConfig] = None,
+) -> SummaryInfo:
+    """Resolve the summary for a bill."""
+    return _resolve_doc(
+        _SUMMARY_SPEC, base_url, cfg, cache, row, deferred_session, pipeline_cfg
+    )
+
+
 def resolve_votes_for_bill(
     base_url: str,
     cfg: Config,
     cache: Cache,
     row: BillAtHearing,
     deferred_session: Optional[DeferredReviewSession] = None,
+    pipeline_cfg: Optional[PipelineConfig] = None,
 ) -> VoteInfo:
     """
     Votes pipeline with confirmed-cache short-circuit:
@@ -406,207 +1005,33 @@ def resolve_votes_for_bill(
       * Only show a dialog when review_mode == 'on'.
       * Mark confirmed=True when a user explicitly accepts; False for headless
       auto-accept.
+
+    Pass a PipelineConfig built once per run to avoid re-reading cfg per bill.
     """
-    cached_result = cache.get_votes_result(row.bill_id, row.committee_id)
-    if cached_result and cache.is_votes_confirmed(row.bill_id, row.committee_id):
-        logger.debug("Found votes in cache; skipping votes search...")
-        return VoteInfo.from_dict(cached_result)
-    votes_has_parser = cache.get_votes_parser(row.bill_id, row.committee_id)
-    # 1) Confirmed-cache fast path (silent)
-    if votes_has_parser and cache.is_votes_confirmed(row.bill_id, row.committee_id):
-        mod = VOTES_REGISTRY[votes_has_parser]
-        candidate: Optional[ParserInterface.DiscoveryResult] = mod.discover(
-            base_url, row, cache, cfg
-        )
-        if candidate:
-            doc_text = candidate.full_text if candidate.full_text else ""
-            if not _passes_committee_attribution(doc_text, row.committee_id):
-                logger.debug(
-                    "Confirmed-cache vote rejected for %s/%s: different committee",
-                    row.bill_id,
-                    row.committee_id,
-                )
-            else:
-                parsed = mod.parse(base_url, candidate)
-                result = VoteInfo(
-                    present=True,
-                    location=mod.location,
-                    source_url=candidate.source_url,
-                    parser_module=votes_has_parser,
-                    needs_review=False,
-                )
-                cache.set_votes_result(
-                    row.bill_id,
-                    row.committee_id,
-                    votes_has_parser,
-                    result.to_dict(),
-                    confirmed=True,
-                )
-                cache.record_committee_parser(
-                    row.committee_id,
-                    ParserInterface.ParserType.VOTES.value,
-                    votes_has_parser,
-                )
-                return result
-        # stale or attribution mismatch: fall through to normal flow
-    # 2) Build parser sequence with committee-aware prioritization
-    all_votes_parsers: list[type[ParserInterface]] = [
-        parser
-        for parser in VOTES_REGISTRY.values()
-        if parser.parser_type == ParserInterface.ParserType.VOTES
-    ]
-    # Sort by cost (ascending) - cheaper parsers first
-    all_votes_parsers.sort(key=lambda p: p.cost)
-    # Build tiered priority list with tier tracking
-    # Each entry is (parser, tier, module_name)
-    votes_sequence: list[tuple[type[ParserInterface], ParserTier, str]] = []
-    added_votes_parsers = set()
-    # Tier 0: Bill-specific cache
-    if votes_has_parser and votes_has_parser in VOTES_REGISTRY:
-        parser = VOTES_REGISTRY[votes_has_parser]
-        votes_sequence.append((parser, ParserTier.BILL_CACHED, votes_has_parser))
-        added_votes_parsers.add(parser)
-    # Tier 1: Committee-proven parsers
-    committee_votes_parsers = cache.get_committee_parsers(
-        row.committee_id, ParserInterface.ParserType.VOTES.value
+    return _resolve_doc(
+        _VOTES_SPEC, base_url, cfg, cache, row, deferred_session, pipeline_cfg
     )
-    for module_name in committee_votes_parsers:
-        if module_name in VOTES_REGISTRY:
-            parser = VOTES_REGISTRY[module_name]
-            if parser not in added_votes_parsers:
-                votes_sequence.append(
-                    (parser, ParserTier.COMMITTEE_PROVEN, module_name)
-                )
-                added_votes_parsers.add(parser)
-    # Tier 2: Remaining parsers by cost
-    for parser in all_votes_parsers:
-        if parser not in added_votes_parsers:
-            module_name = parser.__module__
-            votes_sequence.append((parser, ParserTier.COST_FALLBACK, module_name))
-            added_votes_parsers.add(parser)
-    # 3) Try parsers
-    for p, tier, modname in votes_sequence:
-        candidate = p.discover(base_url, row, cache, cfg)
-        if not candidate:
-            continue
-        doc_text = candidate.full_text if candidate.full_text else ""
-        if not _passes_committee_attribution(doc_text, row.committee_id):
-            logger.debug(
-                "Skipping vote candidate for %s/%s: attributed to different committee",
-                row.bill_id,
-                row.committee_id,
-            )
-            continue
-        # Decide whether to prompt
-        accepted = True
-        needs_review = False
-        if cfg.review_mode == "deferred" and deferred_session is not None:
-            # Decide if we should consult LLM based on pattern confidence
-            should_use_llm = should_use_llm_for_parser(
-                modname,
-                row.committee_id,
-                ParserInterface.ParserType.VOTES.value,
-                cache,
-                tier,
-                candidate,
-            )
-            if should_use_llm:
-                # Pattern not established or parser is suspicious - use LLM
-                llm_decision = try_llm_decision(
-                    candidate, row.bill_id, ParserInterface.ParserType.VOTES.value, cfg
-                )
-                if llm_decision == "yes":
-                    # LLM confidently accepts
-                    accepted = True
-                    needs_review = False
-                elif llm_decision == "no":
-                    # LLM confidently rejects - skip this parser
-                    continue
-                else:
-                    # LLM returned "unsure" or is unavailable
-                    # Fall back to confidence threshold logic
-                    preview_text = (
-                        candidate.full_text
-                        if candidate.full_text
-                        else candidate.preview
-                    )
-                    confidence = candidate.confidence if candidate.confidence else 0.5
-                    auto_yes = cfg.deferred_review.auto_accept_high_confidence
-                    if confidence >= auto_yes:
-                        accepted = True
-                        needs_review = False
-                    else:
-                        # Add to deferred session for later review
-                        confirmation = DeferredConfirmation(
-                            confirmation_id="",  # Will be auto-generated
-                            bill_id=row.bill_id,
-                            parser_type=ParserInterface.ParserType.VOTES.value,
-                            parser_module=modname,
-                            candidate=candidate,
-                            preview_text=preview_text,
-                            confidence=confidence,
-                        )
-                        deferred_session.add_confirmation(confirmation)
-                        accepted = True  # Tentatively accept for now
-                        needs_review = True
-            else:
-                # Pattern confidence is high - trust it without LLM
-                accepted = True
-                needs_review = False
-        elif cfg.review_mode == "on":
-            # Use full_text if available, otherwise fall back to preview
-            preview_text = (
-                candidate.full_text if candidate.full_text else candidate.preview
-            )
-            if len(preview_text) > 140:
-                accepted = ask_yes_no_with_preview_and_llm_fallback(
-                    title="Confirm vote record",
-                    heading=f"Use this vote record for {row.bill_id}?",
-                    preview_text=preview_text,
-                    url=candidate.source_url,
-                    doc_type=ParserInterface.ParserType.VOTES.value,
-                    bill_id=row.bill_id,
-                    config=cfg,
-                )
-            else:
-                accepted = ask_yes_no_with_llm_fallback(
-                    preview_text or "Use this vote source?",
-                    candidate.source_url,
-                    doc_type=ParserInterface.ParserType.VOTES.value,
-                    bill_id=row.bill_id,
-                    config=cfg,
-                )
-        else:  # review_mode == "off"
-            # auto-accept in headless mode; not "confirmed"
-            needs_review = True
-        if not accepted:
-            continue
-
-        parsed = p.parse(base_url, candidate)
-        result = VoteInfo(
-            present=True,
-            location=p.location,
-            source_url=parsed.get("source_url"),
-            parser_module=modname,
-            needs_review=needs_review,
-        )
-        cache.set_votes_result(
-            row.bill_id,
-            row.committee_id,
-            modname,
-            result.to_dict(),
-            confirmed=cfg.review_mode == "on" and not needs_review,
+
+
+def resolve_bill(
+    base_url: str,
+    cfg: Config,
+    cache: Cache,
+    row: BillAtHearing,
+    deferred_session: Optional[DeferredReviewSession] = None,
+    pipeline_cfg: Optional[PipelineConfig] = None,
+) -> tuple[SummaryInfo, VoteInfo]:
+    """Resolve summary and votes for a bill, sharing document extraction.
+
+    Summary and vote records often live in the same committee document; both
+    resolvers run in one bill_scope() so it is downloaded and extracted once.
+    """
+    pcfg = pipeline_cfg or PipelineConfig.from_config(cfg)
+    with bill_scope():
+        summary = resolve_summary_for_bill(
+            base_url, cfg, cache, row, deferred_session, pcfg
         )
-        cache.record_committee_parser(
-            row.committee_id, ParserInterface.ParserType.VOTES.value, modname
+        votes = resolve_votes_for_bill(
+            base_url, cfg, cache, row, deferred_session, pcfg
         )
-        return result
-    # 4) Nothing landed
-    return VoteInfo(
-        present=False,
-        location="unknown",
-        source_url=None,
-        parser_module=None,
-        needs_review=False,
-    )
-
+    return summary, votes
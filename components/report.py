@@ -1,5 +1,6 @@
 """Write the basic compliance HTML report."""
 
+from html import escape
 from pathlib import Path
 from datetime import datetime
 from typing import List
@@ -7,6 +8,26 @@ from typing import List
 from components.models import CommitteeContact
 
 
+_STATE_CLASS = {"compliant": "ok", "non-compliant": "bad"}
+
+# Row fields are escaped before they are filled in
+_ROW_TEMPLATE = (
+    "<tr>"
+    "<td><a href='{bill_url}' target='_blank'>{bill_id}</a></td>"
+    "<td>{bill_title}</td>"
+    "<td>{hearing_date}</td>"
+    "<td>{deadline_60}</td>"
+    "<td>{effective_deadline}</td>"
+    "<td class='{notice_class}'>{notice_gap}</td>"
+    "<td>{reported_out}</td>"
+    "<td>{summary}</td>"
+    "<td>{votes}</td>"
+    "<td class='{state_class}'>{state}</td>"
+    "<td>{reason}</td>"
+    "</tr>"
+)
+
+
 # pylint: disable=too-many-locals, too-many-arguments
 # pylint: disable=too-many-positional-arguments
 def write_basic_html(
@@ -50,13 +71,6 @@ def write_basic_html(
     a { text-decoration: none; }
     """
 
-    def cls(state: str) -> str:
-        return (
-            "ok"
-            if state == "compliant"
-            else ("bad" if state == "non-compliant" else "warn")
-        )
-
     now = datetime.now().strftime("%Y-%m-%d %H:%M")
     # Generate contact information HTML
     contact_html = ""
@@ -133,11 +147,11 @@ def write_basic_html(
                 contact_html += vice_chair_info
             contact_html += "</div>"
         contact_html += "</div>"
-    lines = [
+    header = [
         "<!doctype html><meta charset='utf-8'>",
         f"<style>{css}</style>",
-        f"<h1>Basic Compliance -- <a href='{committee_url}' target='_blank'>"
-        f"{comm_name} [{committee_id}]</a></h1>",
+        f"<h1>Basic Compliance -- <a href='{_esc(committee_url)}' target='_blank'>"
+        f"{_esc(comm_name)} [{_esc(committee_id)}]</a></h1>",
         f"<p>Generated {now}</p>",
         contact_html,
         "<table>",
@@ -150,58 +164,71 @@ def write_basic_html(
             "</tr>"
         ),
     ]
-    r: dict[str, str]
-    for r in rows:
-        sum_link = (
-            f"<a href='{r['summary_url']}' target='_blank'>Yes</a>"
-            if r["summary_present"] and r.get("summary_url")
-            else ("Yes" if r["summary_present"] else "--")
-        )
-        vote_link = (
-            f"<a href='{r['votes_url']}' target='_blank'>Yes</a>"
-            if r["votes_present"] and r.get("votes_url")
-            else ("Yes" if r["votes_present"] else "--")
-        )
-        hearing_date = r["hearing_date"] if r["hearing_date"] else "N/A"
-        deadline_60 = r["deadline_60"] if r["deadline_60"] else "N/A"
+    # Stream rows straight to the file instead of joining one big string
+    with outpath.open("w", encoding="utf-8", buffering=65536) as f:
+        f.write("\n".join(header))
+        for r in rows:
+            f.write("\n")
+            f.write(_row_html(r))
+        f.write("\n</table>")
+
+
+def _esc(value: object) -> str:
+    """Escape a value for HTML text or a quoted attribute."""
+    return escape(value if isinstance(value, str) else str(value))
+
+
+def _row_html(r: dict) -> str:
+    """Render one bill as a table row."""
+    sum_link = (
+        f"<a href='{_esc(r['summary_url'])}' target='_blank'>Yes</a>"
+        if r["summary_present"] and r.get("summary_url")
+        else ("Yes" if r["summary_present"] else "--")
+    )
+    vote_link = (
+        f"<a href='{_esc(r['votes_url'])}' target='_blank'>Yes</a>"
+        if r["votes_present"] and r.get("votes_url")
+        else ("Yes" if r["votes_present"] else "--")
+    )
+    hearing_date = _esc(r["hearing_date"]) if r["hearing_date"] else "N/A"
+    deadline_60 = _esc(r["deadline_60"]) if r["deadline_60"] else "N/A"
+    effective_deadline = (
+        _esc(r["effective_deadline"]) if r["effective_deadline"] else "N/A"
+    )
+    if r.get("extension_order_url") and r["effective_deadline"]:
         effective_deadline = (
-            r["effective_deadline"] if r["effective_deadline"] else "N/A"
-        )
-        if r.get("extension_order_url") and r["effective_deadline"]:
-            effective_deadline = (
-                f"<a href='{r['extension_order_url']}' target='_blank'>"
-                f"{r['effective_deadline']}</a>"
-            )
-        rep = "Yes" if r["reported_out"] else "No"
-        notice_gap = "--"
-        notice_class = ""
-        if r.get("notice_gap_days") is not None:
-            gap_days = r["notice_gap_days"]
-            notice_status = r.get("notice_status", "missing")
-            if notice_status == "in_range":
-                notice_gap = f"{gap_days} days"
-                notice_class = "ok"
-            elif notice_status == "out_of_range":
-                notice_gap = f"{gap_days} days"
-                notice_class = "bad"
-        elif r.get("notice_status", "").lower() == "missing":
-            notice_gap = "Missing"
-            notice_class = "warn"
-        lines.append(
-            f"<tr>"
-            f"<td><a href='{r['bill_url']}' target='_blank'>{r['bill_id']}</a>"
-            f"</td>"
-            f"<td>{r.get('bill_title','--')}</td>"
-            f"<td>{hearing_date}</td>"
-            f"<td>{deadline_60}</td>"
-            f"<td>{effective_deadline}</td>"
-            f"<td class='{notice_class}'>{notice_gap}</td>"
-            f"<td>{rep}</td>"
-            f"<td>{sum_link}</td>"
-            f"<td>{vote_link}</td>"
-            f"<td class='{cls(r['state'])}'>{r['state']}</td>"
-            f"<td>{r['reason']}</td>"
-            f"</tr>"
+            f"<a href='{_esc(r['extension_order_url'])}' target='_blank'>"
+            f"{effective_deadline}</a>"
         )
-    lines.append("</table>")
-    outpath.write_text("\n".join(lines), encoding="utf-8")
+    notice_gap = "--"
+    notice_class = ""
+    if r.get("notice_gap_days") is not None:
+        gap_days = r["notice_gap_days"]
+        notice_status = r.get("notice_status", "missing")
+        if notice_status == "in_range":
+            notice_gap = f"{gap_days} days"
+            notice_class = "ok"
+        elif notice_status == "out_of_range":
+            notice_gap = f"{gap_days} days"
+            notice_class = "bad"
+    elif r.get("notice_status", "").lower() == "missing":
+        notice_gap = "Missing"
+        notice_class = "warn"
+    return _ROW_TEMPLATE.format_map(
+        {
+            "bill_url": _esc(r["bill_url"]),
+            "bill_id": _esc(r["bill_id"]),
+            "bill_title": _esc(r.get("bill_title", "--")),
+            "hearing_date": hearing_date,
+            "deadline_60": deadline_60,
+            "effective_deadline": effective_deadline,
+            "notice_class": notice_class,
+            "notice_gap": notice_gap,
+            "reported_out": "Yes" if r["reported_out"] else "No",
+            "summary": sum_link,
+            "votes": vote_link,
+            "state_class": _STATE_CLASS.get(r["state"], "warn"),
+            "state": _esc(r["state"]),
+            "reason": _esc(r["reason"]),
+        }
+    )
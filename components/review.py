@@ -1,11 +1,56 @@
 """Batch review session manager for deferred confirmations."""
 
 import textwrap
+from enum import Enum
+from heapq import nsmallest
+from operator import attrgetter
 
 from components.interfaces import Config
 from components.models import DeferredReviewSession, DeferredConfirmation
 from components.utils import Cache
 
+_SEPARATOR = "=" * 64
+_PREVIEW_RULE = "-" * 64
+_PREVIEW_LINES = 15
+# Accepted parsers are written in batches; at most this many await a commit
+_CONFIRM_BATCH_SIZE = 50
+_WRAPPER = textwrap.TextWrapper(width=80)
+# Every accepted answer, mapped to its one-letter option
+_CHOICES = {
+    "y": "y",
+    "yes": "y",
+    "n": "n",
+    "no": "n",
+    "s": "s",
+    "skip": "s",
+    "a": "a",
+    "all": "a",
+    "q": "q",
+    "quit": "q",
+}
+_OPTIONS = (
+    "Options:\n"
+    "  [y] Accept this parser\n"
+    "  [n] Reject this parser\n"
+    "  [s] Skip (decide later)\n"
+    "  [a] Accept all remaining for this bill\n"
+    "  [q] Quit review session\n"
+)
+
+
+class ReviewDecision(Enum):
+    """What the reviewer chose for one confirmation."""
+
+    ACCEPT = "y"
+    REJECT = "n"
+    SKIP = "s"
+    ACCEPT_ALL_BILL = "a"  # accept this and every remaining one for the bill
+
+    @property
+    def accepted(self) -> bool:
+        """Whether the parser should be confirmed."""
+        return self in (ReviewDecision.ACCEPT, ReviewDecision.ACCEPT_ALL_BILL)
+
 
 def conduct_batch_review(
     session: DeferredReviewSession, config: Config, cache: Cache
@@ -17,9 +62,9 @@ def conduct_batch_review(
     if not session.confirmations:
         print("No confirmations needed for review.")
         return {}
-    print(f"\n{'='*64}")
+    print(f"\n{_SEPARATOR}")
     print(f"BATCH REVIEW SESSION - Committee {session.committee_id}")
-    print(f"{'='*64}")
+    print(_SEPARATOR)
     display_confirmation_summary(session)
     try:
         proceed = (
@@ -34,158 +79,199 @@ def conduct_batch_review(
     results = {}
     total = len(session.confirmations)
     confirmations = session.confirmations
-    if config.deferred_review.group_by_bill:
-        confirmations = sorted(confirmations, key=lambda c: c.bill_id)
-    for i, confirmation in enumerate(confirmations, 1):
-        try:
-            result = review_single_confirmation(confirmation, i, total, config)
-            results[confirmation.confirmation_id] = result
-            if result:
-                if confirmation.parser_type == "votes":
-                    cache.set_votes_parser(
-                        confirmation.bill_id,
-                        session.committee_id,
-                        confirmation.parser_module,
-                        confirmed=True,
-                    )
+    # Config builds a wrapper per access, so read the settings once per session
+    review_cfg = config.deferred_review
+    show_confidence = review_cfg.show_confidence
+    if review_cfg.group_by_bill:
+        confirmations = sorted(confirmations, key=attrgetter("bill_id"))
+    accepted: list[DeferredConfirmation] = []
+    # Bills the reviewer chose "accept all" for; no further prompts for them
+    auto_accept_bill_ids: set[str] = set()
+    try:
+        for i, confirmation in enumerate(confirmations, 1):
+            try:
+                if _already_confirmed(confirmation, session.committee_id, cache):
+                    # e.g. a resumed session; nothing to show or write
+                    results[confirmation.confirmation_id] = True
+                    continue
+                if confirmation.bill_id in auto_accept_bill_ids:
+                    result = True
                 else:
-                    cache.set_parser(
-                        confirmation.bill_id,
-                        confirmation.parser_type,
-                        confirmation.parser_module,
-                        confirmed=True,
+                    decision = review_single_confirmation(
+                        confirmation, i, total, show_confidence
                     )
-        except (KeyboardInterrupt, EOFError):
-            print(
-                f"\nReview session interrupted. Processed "
-                f"{i-1} of {total} confirmations."
-            )
-            break
+                    if decision is ReviewDecision.ACCEPT_ALL_BILL:
+                        auto_accept_bill_ids.add(confirmation.bill_id)
+                    result = decision.accepted
+                results[confirmation.confirmation_id] = result
+                if result:
+                    accepted.append(confirmation)
+                    if len(accepted) >= _CONFIRM_BATCH_SIZE:
+                        _confirm_parsers(accepted, session.committee_id, cache)
+            except (KeyboardInterrupt, EOFError):
+                print(
+                    f"\nReview session interrupted. Processed "
+                    f"{i-1} of {total} confirmations."
+                )
+                break
+    finally:
+        _confirm_parsers(accepted, session.committee_id, cache)
     return results
 
 
+def _already_confirmed(
+    confirmation: DeferredConfirmation, committee_id: str, cache: Cache
+) -> bool:
+    """Whether the cache already has this exact parser confirmed for the bill."""
+    if confirmation.parser_type == "votes":
+        confirmed = cache.get_confirmed_votes_parser(confirmation.bill_id, committee_id)
+    else:
+        confirmed = cache.get_confirmed_parser(
+            confirmation.bill_id, confirmation.parser_type
+        )
+    return confirmed == confirmation.parser_module
+
+
+def _confirm_parsers(
+    accepted: list[DeferredConfirmation], committee_id: str, cache: Cache
+) -> None:
+    """Confirm the accepted parsers in one cache transaction and clear the list."""
+    if not accepted:
+        return
+    with cache.batched():
+        for confirmation in accepted:
+            if confirmation.parser_type == "votes":
+                cache.set_votes_parser(
+                    confirmation.bill_id,
+                    committee_id,
+                    confirmation.parser_module,
+                    confirmed=True,
+                )
+            else:
+                cache.set_parser(
+                    confirmation.bill_id,
+                    confirmation.parser_type,
+                    confirmation.parser_module,
+                    confirmed=True,
+                )
+    accepted.clear()
+
+
 def display_confirmation_summary(session: DeferredReviewSession) -> None:
     """Show overview of all pending confirmations."""
     summary_count = session.get_summary_count()
     votes_count = session.get_votes_count()
-    bill_count = len(session.get_bill_ids())
-    print(
-        f"Found {len(session.confirmations)} parser confirmations " "requiring review:"
-    )
+    bill_ids = session.get_bill_ids()
+    bill_count = len(bill_ids)
+    lines = [
+        f"Found {len(session.confirmations)} parser confirmations requiring review:"
+    ]
     if summary_count > 0:
-        print(f"  - {summary_count} summaries ({bill_count} bills)")
+        lines.append(f"  - {summary_count} summaries ({bill_count} bills)")
     if votes_count > 0:
-        print(f"  - {votes_count} vote records ({bill_count} bills)")
-    bill_ids = session.get_bill_ids()
-    if len(bill_ids) <= 10:
-        print(f"\nBills: {', '.join(sorted(bill_ids))}")
+        lines.append(f"  - {votes_count} vote records ({bill_count} bills)")
+    if bill_count <= 10:
+        lines.append(f"\nBills: {', '.join(sorted(bill_ids))}")
     else:
-        print(
-            f"\nBills: {', '.join(sorted(bill_ids[:10]))} ..."
-            f" and {len(bill_ids)-10} more"
+        lines.append(
+            f"\nBills: {', '.join(nsmallest(10, bill_ids))} ..."
+            f" and {bill_count-10} more"
         )
+    print("\n".join(lines))
 
 
 def review_single_confirmation(
-    confirmation: DeferredConfirmation, index: int, total: int, config: Config
-) -> bool:
+    confirmation: DeferredConfirmation, index: int, total: int, show_confidence: bool
+) -> ReviewDecision:
     """
     Review one confirmation with context.
-    Returns True if accepted, False if rejected.
+    Returns the reviewer's decision; quitting raises KeyboardInterrupt.
     """
-    print(f"\n{'='*64}")
-    print(
+    # One write per confirmation instead of one per line
+    print(_render_confirmation(confirmation, index, total, show_confidence), end="")
+    while True:
+        choice = _CHOICES.get(input("Choice (y/n/s/a/q): ").strip().lower())
+        if choice == "q":
+            raise KeyboardInterrupt()
+        if choice is None:
+            print(
+                "Please enter 'y' for yes, 'n' for no, 's' "
+                "to skip, 'a' for accept all, or 'q' to quit."
+            )
+            continue
+        decision = ReviewDecision(choice)
+        if decision is ReviewDecision.SKIP:
+            print("Skipped - will remain unconfirmed.")
+        elif decision is ReviewDecision.ACCEPT_ALL_BILL:
+            print(
+                f"Accepting all remaining confirmations for bill "
+                f"{confirmation.bill_id}"
+            )
+        return decision
+
+
+def _render_confirmation(
+    confirmation: DeferredConfirmation, index: int, total: int, show_confidence: bool
+) -> str:
+    """Everything shown for one confirmation before its prompt."""
+    parts = [
+        f"\n{_SEPARATOR}\n",
         f"CONFIRMATION {index} of {total} - Bill "
-        f"{confirmation.bill_id} ({confirmation.parser_type.title()})"
-    )
-    print(f"{'='*64}")
-    print(f"Parser: {confirmation.parser_module}")
-    if config.deferred_review.show_confidence and confirmation.confidence is not None:
+        f"{confirmation.bill_id} ({confirmation.parser_type.title()})\n",
+        f"{_SEPARATOR}\n",
+        f"Parser: {confirmation.parser_module}\n",
+    ]
+    if show_confidence and confirmation.confidence is not None:
         confidence_pct = int(confirmation.confidence * 100)
         confidence_label: str = (
             "High"
             if confirmation.confidence >= 0.8
             else "Medium" if confirmation.confidence >= 0.5 else "Low"
         )
-        print(f"Confidence: {confidence_label} ({confidence_pct}%)")
+        parts.append(f"Confidence: {confidence_label} ({confidence_pct}%)\n")
     source_url = confirmation.candidate.source_url
     if source_url:
-        print(f"URL: {source_url}")
+        parts.append(f"URL: {source_url}\n")
     if confirmation.preview_text:
-        print("\nPreview:")
-        print("-" * 64)
+        parts.append("\nPreview:\n")
+        parts.append(f"{_PREVIEW_RULE}\n")
         wrapped_lines = []
-        for line in confirmation.preview_text.split("\n"):
-            if line.strip():
-                wrapped_lines.extend(textwrap.wrap(line, width=80))
+        source_lines = confirmation.preview_text.split("\n")
+        consumed = 0
+        # Only wrap until the preview is full; the rest is counted, not wrapped
+        for line in source_lines:
+            if len(wrapped_lines) > _PREVIEW_LINES:
+                break
+            consumed += 1
+            if line and not line.isspace():
+                wrapped_lines.extend(_WRAPPER.wrap(line))
             else:
                 wrapped_lines.append("")
-        display_lines = wrapped_lines[:15]
-        for line in display_lines:
-            print(line)
-        if len(wrapped_lines) > 15:
-            print(f"\n... ({len(wrapped_lines) - 15} more lines)")
-        print("-" * 64)
-    print(f"{'='*64}")
-    print("Options:")
-    print("  [y] Accept this parser")
-    print("  [n] Reject this parser")
-    print("  [s] Skip (decide later)")
-    print("  [a] Accept all remaining for this bill")
-    print("  [q] Quit review session")
-    print()
-    while True:
-        choice = input("Choice (y/n/s/a/q): ").strip().lower()
-        if choice in ["y", "yes"]:
-            return True
-        elif choice in ["n", "no"]:
-            return False
-        elif choice in ["s", "skip"]:
-            print("Skipped - will remain unconfirmed.")
-            return False
-        elif choice in ["a", "all"]:
-            print(
-                f"Accepting all remaining confirmations for bill "
-                f"{confirmation.bill_id}"
-            )
-            return True
-        elif choice in ["q", "quit"]:
-            raise KeyboardInterrupt()
-        else:
-            print(
-                "Please enter 'y' for yes, 'n' for no, 's' "
-                "to skip, 'a' for accept all, or 'q' to quit."
-            )
+        for line in wrapped_lines[:_PREVIEW_LINES]:
+            parts.append(f"{line}\n")
+        hidden = len(wrapped_lines) - _PREVIEW_LINES
+        if consumed < len(source_lines):
+            # Each unwrapped source line is at least one more line
+            hidden += len(source_lines) - consumed
+            parts.append(f"\n... ({hidden}+ more lines)\n")
+        elif hidden > 0:
+            parts.append(f"\n... ({hidden} more lines)\n")
+        parts.append(f"{_PREVIEW_RULE}\n")
+    parts.append(f"{_SEPARATOR}\n")
+    parts.append(f"{_OPTIONS}\n")
+    return "".join(parts)
 
 
-def apply_review_results(
+def apply_review_results(  # pylint: disable=unused-argument
     results: dict[str, bool], session: DeferredReviewSession, cache: Cache
 ) -> None:
-    """Apply the review results to the cache system."""
-    accepted_count = 0
-    rejected_count = 0
-    for confirmation in session.confirmations:
-        confirmation_id = confirmation.confirmation_id
-        if confirmation_id in results:
-            accepted = results[confirmation_id]
-            if accepted:
-                if confirmation.parser_type == "votes":
-                    cache.set_votes_parser(
-                        confirmation.bill_id,
-                        session.committee_id,
-                        confirmation.parser_module,
-                        confirmed=True,
-                    )
-                else:
-                    cache.set_parser(
-                        confirmation.bill_id,
-                        confirmation.parser_type,
-                        confirmation.parser_module,
-                        confirmed=True,
-                    )
-                accepted_count += 1
-            else:
-                rejected_count += 1
+    """Report the review results.
+
+    Accepted parsers are already confirmed in the cache by
+    conduct_batch_review, so this only tallies and prints the outcome.
+    """
+    accepted_count = sum(results.values())
+    rejected_count = len(results) - accepted_count
     print("\nReview session complete:")
     print(f"  - Accepted: {accepted_count}")
     print(f"  - Rejected: {rejected_count}")
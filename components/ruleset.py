@@ -11,7 +11,10 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import date, timedelta
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import ClassVar, Optional
 
 from components.models import BillStatus, SummaryInfo, VoteInfo
 from components.compliance import BillCompliance, ComplianceState
@@ -68,12 +71,17 @@ class CommitteeType(str, Enum):
     @staticmethod
     def get_notice_requirement(committee_type: CommitteeType) -> int:
         """Get the notice requirement for a committee type."""
-        _notice_matrix = {
-            CommitteeType.HOUSE: 0,
-            CommitteeType.SENATE: 5,
-            CommitteeType.JOINT: 10,
-        }
-        return _notice_matrix[committee_type]
+        return _NOTICE_REQUIREMENT[committee_type]
+
+
+# Days of advance hearing notice required, by committee type
+_NOTICE_REQUIREMENT = MappingProxyType(
+    {
+        CommitteeType.HOUSE: 0,
+        CommitteeType.SENATE: 5,
+        CommitteeType.JOINT: 10,
+    }
+)
 
 
 @dataclass(frozen=True)
@@ -122,15 +130,12 @@ class ComplianceRule(ABC):
     bill and committee characteristics.
     """
 
-    @property
-    @abstractmethod
-    def priority(self) -> int:
-        """Priority for rule evaluation (lower = evaluated first)."""
-
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Human-readable name of this rule."""
+    # Priority for rule evaluation (lower = evaluated first)
+    priority: ClassVar[int]
+    # Human-readable name of this rule
+    name: ClassVar[str]
+    # True for ReportedOut, Votes and Summary rules (counted)
+    is_core: ClassVar[bool] = False
 
     @abstractmethod
     def check(
@@ -172,7 +177,7 @@ class ComplianceRule(ABC):
 
     def is_core_requirement(self) -> bool:
         """Return True if this rule is a core requirement (counted)."""
-        return False  # Override in ReportedOut, Votes, Summary rules
+        return self.is_core
 
     def contributes_to_reason(self, result: RuleResult) -> Optional[str]:
         """Return a string to add to the final reason, or None."""
@@ -182,13 +187,8 @@ class ComplianceRule(ABC):
 class NoticeRequirementRule(ComplianceRule):
     """Rule checking advance notice requirements for hearings."""
 
-    @property
-    def priority(self) -> int:
-        return 1
-
-    @property
-    def name(self) -> str:
-        return "Advance Notice Requirement"
+    priority = 1
+    name = "Advance Notice Requirement"
 
     def check(
         self,
@@ -212,9 +212,7 @@ class NoticeRequirementRule(ComplianceRule):
         days_notice: int = (
             status.scheduled_hearing_date - status.announcement_date
         ).days
-        notice_requirement: int = CommitteeType.get_notice_requirement(
-            context.committee_type
-        )
+        notice_requirement: int = _NOTICE_REQUIREMENT[context.committee_type]
         if status.announcement_date < Constants194.notice_requirement_start_date:
             notice_requirement = 0
             # Exempt from notice requirement
@@ -289,13 +287,9 @@ class ReportedOutRequirementRule(ComplianceRule):
       (equivalent to classify() lines 175-198)
     """
 
-    @property
-    def priority(self) -> int:
-        return 2
-
-    @property
-    def name(self) -> str:
-        return "Deadline Requirement"
+    priority = 2
+    name = "Deadline Requirement"
+    is_core = True
 
     def check(
         self,
@@ -431,9 +425,6 @@ class ReportedOutRequirementRule(ComplianceRule):
             reason_parts.append(notice_desc)
         return (ComplianceState.UNKNOWN, ", ".join(reason_parts))
 
-    def is_core_requirement(self) -> bool:
-        return True
-
     def contributes_to_reason(self, result: RuleResult) -> Optional[str]:
         if result.passed != Status.COMPLIANT and result.missing_description:
             return result.missing_description
@@ -449,13 +440,9 @@ class VoteRequirementRule(ComplianceRule):
     - Missing votes contribute to non-compliance
     """
 
-    @property
-    def priority(self) -> int:
-        return 5
-
-    @property
-    def name(self) -> str:
-        return "Vote Requirement"
+    priority = 5
+    name = "Vote Requirement"
+    is_core = True
 
     def check(
         self,
@@ -477,9 +464,6 @@ class VoteRequirementRule(ComplianceRule):
             missing_description="no votes posted",
         )
 
-    def is_core_requirement(self) -> bool:
-        return True
-
     def contributes_to_reason(self, result: RuleResult) -> Optional[str]:
         if result.passed != Status.COMPLIANT and result.missing_description:
             return result.missing_description
@@ -495,13 +479,9 @@ class SummaryRequirementRule(ComplianceRule):
     - Missing summaries contribute to non-compliance
     """
 
-    @property
-    def priority(self) -> int:
-        return 4
-
-    @property
-    def name(self) -> str:
-        return "Summary Requirement"
+    priority = 4
+    name = "Summary Requirement"
+    is_core = True
 
     def check(
         self,
@@ -523,9 +503,6 @@ class SummaryRequirementRule(ComplianceRule):
             missing_description="no summaries posted",
         )
 
-    def is_core_requirement(self) -> bool:
-        return True
-
     def contributes_to_reason(self, result: RuleResult) -> Optional[str]:
         if result.passed != Status.COMPLIANT and result.missing_description:
             return result.missing_description
@@ -545,7 +522,9 @@ class ComplianceRuleSet:
         Args:
             rules: List of rules, will be sorted by priority
         """
-        self.rules = sorted(rules, key=lambda r: r.priority)
+        self.rules: tuple[ComplianceRule, ...] = tuple(
+            sorted(rules, key=attrgetter("priority"))
+        )
 
     def evaluate(
         self,
@@ -553,14 +532,20 @@ class ComplianceRuleSet:
         status: BillStatus,
         summary: SummaryInfo,
         votes: VoteInfo,
+        thorough: bool = True,
     ) -> list[tuple[ComplianceRule, RuleResult]]:
-        """Evaluate all rules in this set.
+        """Evaluate the rules in this set.
 
         Args:
             context: Bill and committee context
             status: Bill status information
             summary: Summary information
             votes: Vote information
+            thorough: Run every rule even after a deal-breaker fails. With
+                False the list stops at the failed deal-breaker;
+                aggregate_to_compliance still reaches the same state, but
+                its reason names only the deal-breaker, since the deadline
+                and missing-document factors come from the skipped rules.
 
         Returns:
             List of (rule, result) tuples, ordered by priority
@@ -569,9 +554,33 @@ class ComplianceRuleSet:
         for rule in self.rules:
             result = rule.check(context, status, summary, votes)
             rule_results.append((rule, result))
+            if not thorough and rule.is_deal_breaker(result):
+                break
         return rule_results
 
 
+@lru_cache(maxsize=None)
+def _rule_set_for(committee_type: CommitteeType) -> ComplianceRuleSet:
+    """Build the rule set for a committee type once and share it.
+
+    Rules hold no state and evaluate() does not modify the set, so every
+    bill in a committee of the same type can use the same instance.
+    """
+    notice_rule: NoticeRequirementRule = NoticeRequirementRule()
+    report_rule: ReportedOutRequirementRule = ReportedOutRequirementRule()
+    summary_rule: SummaryRequirementRule = SummaryRequirementRule()
+    vote_rule: VoteRequirementRule = VoteRequirementRule()
+    rules: list[ComplianceRule] = [
+        notice_rule,
+        report_rule,
+        summary_rule,
+        vote_rule,
+    ]
+    if committee_type == CommitteeType.HOUSE:
+        rules.remove(notice_rule)
+    return ComplianceRuleSet(rules)
+
+
 class RuleFactory:
     """Factory for creating appropriate rule sets based on bill context."""
 
@@ -585,19 +594,7 @@ class RuleFactory:
         Returns:
             ComplianceRuleSet with rules appropriate for this context
         """
-        notice_rule: NoticeRequirementRule = NoticeRequirementRule()
-        report_rule: ReportedOutRequirementRule = ReportedOutRequirementRule()
-        summary_rule: SummaryRequirementRule = SummaryRequirementRule()
-        vote_rule: VoteRequirementRule = VoteRequirementRule()
-        rules: list[ComplianceRule] = [
-            notice_rule,
-            report_rule,
-            summary_rule,
-            vote_rule,
-        ]
-        if context.committee_type == CommitteeType.HOUSE:
-            rules.remove(notice_rule)
-        return ComplianceRuleSet(rules)
+        return _rule_set_for(context.committee_type)
 
     @staticmethod
     def create_context(
@@ -691,24 +688,35 @@ def aggregate_to_compliance(
             reason=("No hearing scheduled - " "cannot evaluate deadline compliance"),
         )
     if is_study_order_without_hearing:
-        for rule, result in rule_results:
-            if isinstance(rule, ReportedOutRequirementRule):
-                if result.passed == Status.COMPLIANT:
-                    state = ComplianceState.COMPLIANT
-                elif result.passed == Status.NON_COMPLIANT:
-                    state = ComplianceState.NON_COMPLIANT
-                else:
-                    state = ComplianceState.UNKNOWN
-                return BillCompliance(
-                    bill_id=context.bill_id,
-                    committee_id=context.committee_id,
-                    hearing_date=None,
-                    summary=summary,
-                    votes=votes,
-                    status=status,
-                    state=state,
-                    reason=result.reason,
-                )
+        report_result = next(
+            (
+                result
+                for rule, result in rule_results
+                if isinstance(rule, ReportedOutRequirementRule)
+            ),
+            None,
+        )
+        if report_result is None:
+            # A quick evaluate() stops at a failed notice rule, before this one
+            report_result = ReportedOutRequirementRule().check(
+                context, status, summary, votes
+            )
+        if report_result.passed == Status.COMPLIANT:
+            state = ComplianceState.COMPLIANT
+        elif report_result.passed == Status.NON_COMPLIANT:
+            state = ComplianceState.NON_COMPLIANT
+        else:
+            state = ComplianceState.UNKNOWN
+        return BillCompliance(
+            bill_id=context.bill_id,
+            committee_id=context.committee_id,
+            hearing_date=None,
+            summary=summary,
+            votes=votes,
+            status=status,
+            state=state,
+            reason=report_result.reason,
+        )
     deal_breaker_result = None
     for rule, result in rule_results:
         if rule.is_deal_breaker(result):
@@ -806,6 +814,7 @@ def classify(
     status: BillStatus,
     summary: SummaryInfo,
     votes: VoteInfo,
+    thorough: bool = True,
 ) -> BillCompliance:
     """Classify bill compliance using ruleset approach.
 
@@ -818,11 +827,14 @@ def classify(
         status: Bill status information
         summary: Summary information
         votes: Vote information
+        thorough: Evaluate every rule so the reason lists all factors;
+            False stops at the first failed deal-breaker and gives the
+            same state with a shorter reason
 
     Returns:
         BillCompliance with final state and reason
     """
     context = RuleFactory.create_context(bill_id, committee_id)
     rule_set = RuleFactory.create_rule_set(context)
-    rule_results = rule_set.evaluate(context, status, summary, votes)
+    rule_results = rule_set.evaluate(context, status, summary, votes, thorough)
     return aggregate_to_compliance(rule_results, context, status, summary, votes)
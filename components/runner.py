@@ -12,8 +12,10 @@ from typing import Optional
 import niquests as requests  # type: ignore
 
 from components.pipeline import (
-    resolve_summary_for_bill,
-    resolve_votes_for_bill,
+    PipelineConfig,
+    get_cache_hit_counts,
+    get_fast_path_hit_counts,
+    resolve_bill,
 )
 from components.committees import get_committees
 from components.compliance import compute_notice_status
@@ -104,6 +106,7 @@ def _process_single_bill(
     row: BillAtHearing,
     extension_lookup: dict[str, list[ExtensionOrder]],
     deferred_session,
+    pipeline_cfg: Optional[PipelineConfig] = None,
 ) -> dict:
     """Process a single bill (thread-safe).
 
@@ -114,6 +117,7 @@ def _process_single_bill(
         row: BillAtHearing instance
         extension_lookup: Dictionary of extension orders
         deferred_session: Deferred review session (thread-safe)
+        pipeline_cfg: Per-run snapshot of the config values the resolvers read
 
     Returns:
         Dictionary with bill processing results
@@ -151,8 +155,9 @@ def _process_single_bill(
                 except (ValueError, KeyError):
                     extension_until = None
         status: BillStatus = build_status_row(base_url, row, extension_until)
-        summary = resolve_summary_for_bill(base_url, cfg, cache, row, deferred_session)
-        votes = resolve_votes_for_bill(base_url, cfg, cache, row, deferred_session)
+        summary, votes = resolve_bill(
+            base_url, cfg, cache, row, deferred_session, pipeline_cfg
+        )
         comp = classify(row.bill_id, row.committee_id, status, summary, votes)
         bill_title: Optional[str] = cache.get_title(row.bill_id)
         if bill_title is None:
@@ -319,6 +324,8 @@ def run_basic_compliance(
         logger.warning("Could not extract session from bill URLs")
         # Try to get session from cache if available
         session = cache.get_session()
+    # discover() results are memoized per run; start each committee fresh
+    cache.clear_discover_memo()
     logger.info("Processing %d total bills...", len(rows))
     logger.info("  - %d with hearings", len(hearing_bills))
     logger.info("  - %d without hearings", len(non_hearing_bills))
@@ -331,6 +338,9 @@ def run_basic_compliance(
             "Deferred review mode enabled - "
             "confirmations will be collected for batch review."
         )
+    pipeline_cfg = PipelineConfig.from_config(cfg)
+    hits_before = get_cache_hit_counts()
+    fast_before = get_fast_path_hit_counts()
     results = []
     total_bills = len(rows)
     start_time = time.time()
@@ -349,7 +359,13 @@ def run_basic_compliance(
         def process_and_track(row: BillAtHearing) -> dict:
             """Process bill and update progress."""
             result = _process_single_bill(
-                base_url, cfg, cache, row, extension_lookup, deferred_session
+                base_url,
+                cfg,
+                cache,
+                row,
+                extension_lookup,
+                deferred_session,
+                pipeline_cfg,
             )
             with results_lock:
                 processed_count[0] += 1
@@ -387,7 +403,13 @@ def run_basic_compliance(
                 int(start_time),
             )
             result = _process_single_bill(
-                base_url, cfg, cache, row, extension_lookup, deferred_session
+                base_url,
+                cfg,
+                cache,
+                row,
+                extension_lookup,
+                deferred_session,
+                pipeline_cfg,
             )
             if result:
                 results.append(result)
@@ -397,6 +419,18 @@ def run_basic_compliance(
             "Complete",
             int(start_time),
         )
+    hits = get_cache_hit_counts()
+    logger.info(
+        "Cache hits: summary=%d votes=%d",
+        hits["summary"] - hits_before["summary"],
+        hits["votes"] - hits_before["votes"],
+    )
+    fast = get_fast_path_hit_counts()
+    logger.info(
+        "Fast path hits: summary=%d votes=%d",
+        fast["summary"] - fast_before["summary"],
+        fast["votes"] - fast_before["votes"],
+    )
     if (
         cfg.review_mode == "deferred"
         and deferred_session
@@ -43,6 +43,7 @@ class SummaryAccompaniedCommitteeParser(ParserInterface):
     location = "Accompanied bill Committee Summary document"
     cost = 4
     file_format = "document"
+    parse_is_source_only = True
 
     @staticmethod
     def _find_bill_specific_doc(
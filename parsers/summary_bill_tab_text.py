@@ -20,6 +20,7 @@ class SummaryBillTabTextParser(ParserInterface):
     location = "Bill page summary tab"
     cost = 2
     file_format = "html"
+    parse_is_source_only = True
 
     @staticmethod
     def _normalize_bill_url(bill_url: str) -> str:
@@ -21,6 +21,7 @@ class SummaryCommitteeDocxParser(ParserInterface):
     location = "Committee page Word document"
     cost = 3
     file_format = "docx"
+    parse_is_source_only = True
 
     @staticmethod
     def _extract_docx_text(docx_url: str, cache=None, config=None) -> Optional[str]:
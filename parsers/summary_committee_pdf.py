@@ -21,6 +21,7 @@ class SummaryCommitteePdfParser(ParserInterface):
     location = "committee page PDF"
     cost = 4
     file_format = "pdf"
+    parse_is_source_only = True
 
     @staticmethod
     def _find_committee_summary_pdf(
@@ -22,6 +22,7 @@ class SummaryHearingDocsDocxParser(ParserInterface):
     location = "Hearing page Documents tab DOCX"
     cost = 2
     file_format = "docx"
+    parse_is_source_only = True
 
     @staticmethod
     def _norm_bill_id(s: str) -> str:
@@ -119,6 +120,13 @@ class SummaryHearingDocsDocxParser(ParserInterface):
             return extracted.strip()
         return None
 
+    @classmethod
+    def probe(
+        cls, base_url: str, bill: BillAtHearing, cache=None, config=None
+    ) -> Optional[bool]:
+        """Rule out bills with no hearing page to look at."""
+        return bill.hearing_url is not None
+
     @classmethod
     def discover(
         cls, base_url: str, bill: BillAtHearing, cache=None, config=None
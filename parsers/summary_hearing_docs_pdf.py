@@ -22,6 +22,7 @@ class SummaryHearingDocsPdfParser(ParserInterface):
     location = "Hearing page Documents tab PDF"
     cost = 1
     file_format = "pdf"
+    parse_is_source_only = True
 
     @staticmethod
     def _norm_bill_id(s: str) -> str:
@@ -89,6 +90,13 @@ class SummaryHearingDocsPdfParser(ParserInterface):
                 return line
         return None
 
+    @classmethod
+    def probe(
+        cls, base_url: str, bill: BillAtHearing, cache=None, config=None
+    ) -> Optional[bool]:
+        """Rule out bills with no hearing page to look at."""
+        return bill.hearing_url is not None
+
     @classmethod
     def discover(
         cls, base_url: str, bill: BillAtHearing, cache=None, config=None
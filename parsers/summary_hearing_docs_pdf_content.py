@@ -25,6 +25,7 @@ class SummaryHearingDocsPdfContentParser(ParserInterface):
     location = "Hearing page Documents tab PDF content"
     cost = 6
     file_format = "pdf"
+    parse_is_source_only = True
 
     @staticmethod
     def _norm_bill_id(s: str) -> str:
@@ -207,6 +208,13 @@ class SummaryHearingDocsPdfContentParser(ParserInterface):
 
         return None
 
+    @classmethod
+    def probe(
+        cls, base_url: str, bill: BillAtHearing, cache=None, config=None
+    ) -> Optional[bool]:
+        """Rule out bills with no hearing page to look at."""
+        return bill.hearing_url is not None
+
     @classmethod
     def discover(
         cls, base_url: str, bill: BillAtHearing, cache=None, config=None
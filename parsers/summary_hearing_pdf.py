@@ -28,6 +28,7 @@ class SummaryHearingPdfParser(ParserInterface):
     location = "Hearing page PDF"
     cost = 5
     file_format = "pdf"
+    parse_is_source_only = True
 
     @staticmethod
     def _find_candidate_pdf(soup: BeautifulSoup, base_url: str) -> Optional[str]:
@@ -46,6 +47,13 @@ class SummaryHearingPdfParser(ParserInterface):
                 return urljoin(base_url, href)
         return None
 
+    @classmethod
+    def probe(
+        cls, base_url: str, bill: BillAtHearing, cache=None, config=None
+    ) -> Optional[bool]:
+        """Rule out bills with no hearing page to look at."""
+        return bill.hearing_id is not None
+
     @classmethod
     def discover(
         cls, base_url: str, bill: BillAtHearing, cache=None, config=None
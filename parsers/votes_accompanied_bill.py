@@ -40,6 +40,7 @@ class VotesAccompaniedBillParser(ParserInterface):
     location = "Accompanied bill Votes tab"
     cost = 3
     file_format = "html"
+    parse_is_source_only = True
 
     @classmethod
     def discover(
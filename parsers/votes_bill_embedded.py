@@ -19,6 +19,7 @@ class VotesBillEmbeddedParser(ParserInterface):
     location = "Bill page Votes tab"
     cost = 1
     file_format = "html"
+    parse_is_source_only = True
 
     @staticmethod
     def _pick_for_committee(candidates: list, committee_id: str) -> BeautifulSoup:
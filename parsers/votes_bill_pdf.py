@@ -22,6 +22,7 @@ class VotesBillPdfParser(ParserInterface):
     location = "Bill page PDF"
     cost = 5
     file_format = "pdf"
+    parse_is_source_only = True
 
     @staticmethod
     def _extract_pdf_text(pdf_url: str, cache=None, config=None) -> Optional[str]:
@@ -28,6 +28,7 @@ class VotesHearingCommitteeDocumentsParser(ParserInterface):
     location = "Hearing page Documents tab"
     cost = 2
     file_format = "pdf"
+    parse_is_source_only = True
 
     @staticmethod
     def _extract_pdf_text(
@@ -49,6 +50,13 @@ class VotesHearingCommitteeDocumentsParser(ParserInterface):
             return True
         return False
 
+    @classmethod
+    def probe(
+        cls, base_url: str, bill: BillAtHearing, cache=None, config=None
+    ) -> Optional[bool]:
+        """Rule out bills with no hearing page to look at."""
+        return bill.hearing_url is not None
+
     @classmethod
     def discover(
         cls, base_url: str, bill: BillAtHearing, cache=None, config=None
@@ -6,6 +6,7 @@ from pathlib import Path
 from datetime import date
 from unittest.mock import patch
 
+from components.cache import CacheDB
 from unit.fixtures.bill_factory import BillFactory
 from unit.fixtures.timeline_factory import TimelineFactory
 from unit.fixtures.date_helpers import DateScenarios
@@ -39,6 +40,12 @@ def real_bills():
     return {}
 
 
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache backed by temporary databases."""
+    return CacheDB(path=tmp_path / "cache.db")
+
+
 @pytest.fixture
 def mock_today():
     """Allow tests to control the 'current date'."""
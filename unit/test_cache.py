@@ -0,0 +1,303 @@
+"""Tests for the SQLite-backed CacheDB."""
+
+import threading
+
+import pytest
+
+from components import cache as cache_module
+from components.cache import CacheDB
+from components.models import SummaryInfo
+
+
+class TestLlmDecisionCache:
+    """Persisted LLM decisions keyed by prompt hash."""
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get_llm_decision("missing", max_age_days=30) is None
+
+    def test_round_trip(self, cache):
+        cache.set_llm_decision("abc", "yes")
+        assert cache.get_llm_decision("abc", max_age_days=30) == "yes"
+
+    def test_overwrite_replaces_decision(self, cache):
+        cache.set_llm_decision("abc", "unsure")
+        cache.set_llm_decision("abc", "no")
+        assert cache.get_llm_decision("abc", max_age_days=30) == "no"
+
+    def test_expired_entry_is_ignored(self, cache):
+        cache.set_llm_decision("abc", "yes")
+        cache._conn.execute(
+            "UPDATE llm_decisions SET created_at='2000-01-01T00:00:00Z' WHERE key='abc'"
+        )
+        assert cache.get_llm_decision("abc", max_age_days=30) is None
+
+
+class TestLlmRejections:
+    """Persisted LLM "no" verdicts per bill, parser and document."""
+
+    def test_round_trip(self, cache):
+        assert not cache.is_llm_rejected("H1", "summary", "parsers.a", "ab", 30)
+        cache.record_llm_rejection("H1", "summary", "parsers.a", "ab")
+        assert cache.is_llm_rejected("H1", "summary", "parsers.a", "ab", 30)
+        assert not cache.is_llm_rejected("H1", "summary", "parsers.a", "cd", 30)
+        assert not cache.is_llm_rejected("H2", "summary", "parsers.a", "ab", 30)
+
+    def test_expired_rejection_is_ignored(self, cache):
+        cache.record_llm_rejection("H1", "summary", "parsers.a", "ab")
+        cache._conn.execute(
+            "UPDATE llm_rejections SET created_at='2000-01-01T00:00:00Z'"
+        )
+        assert not cache.is_llm_rejected("H1", "summary", "parsers.a", "ab", 30)
+
+
+class TestDiscoverMemo:
+    """In-memory memo of discover() results for a single run."""
+
+    def test_computes_once_per_key(self, cache):
+        calls = []
+
+        def discover():
+            calls.append(1)
+            return "result"
+
+        key = ("parsers.summary_hearing_docs_pdf", "H1", "J10", "123")
+        assert cache.memoize_discover(key, discover) == "result"
+        assert cache.memoize_discover(key, discover) == "result"
+        assert len(calls) == 1
+
+    def test_none_is_memoized(self, cache):
+        calls = []
+
+        def discover():
+            calls.append(1)
+
+        key = ("parsers.votes_bill_pdf", "H1", "J10", "")
+        assert cache.memoize_discover(key, discover) is None
+        assert cache.memoize_discover(key, discover) is None
+        assert len(calls) == 1
+
+    def test_clear_forces_recompute(self, cache):
+        key = ("parsers.votes_bill_pdf", "H1", "J10", "")
+        cache.memoize_discover(key, lambda: "first")
+        cache.clear_discover_memo()
+        assert cache.memoize_discover(key, lambda: "second") == "second"
+
+
+class TestConfirmedLookups:
+    """Single-query lookups that only return confirmed entries."""
+
+    def test_unconfirmed_result_is_hidden(self, cache):
+        cache.set_result(
+            "H1", "summary", "parsers.a", {"present": True}, confirmed=False
+        )
+        assert cache.get_confirmed_entry("H1", "summary")[1] is None
+        assert cache.get_confirmed_parser("H1", "summary") is None
+        assert cache.get_parser("H1", "summary") == "parsers.a"
+
+    def test_confirmed_result_is_returned(self, cache):
+        cache.set_result(
+            "H1", "summary", "parsers.a", {"present": True}, confirmed=True
+        )
+        assert cache.get_confirmed_entry("H1", "summary")[1] == {"present": True}
+        assert cache.get_confirmed_parser("H1", "summary") == "parsers.a"
+
+    def test_votes_are_scoped_to_committee(self, cache):
+        cache.set_votes_result(
+            "H1", "J10", "parsers.v", {"present": True}, confirmed=True
+        )
+        assert cache.get_confirmed_votes_entry("H1", "J10")[1] == {"present": True}
+        assert cache.get_confirmed_votes_parser("H1", "J10") == "parsers.v"
+        assert cache.get_confirmed_votes_entry("H1", "J11")[1] is None
+        assert cache.get_confirmed_votes_parser("H1", "J11") is None
+
+    def test_confirmed_entry_returns_parser_and_result(self, cache):
+        assert cache.get_confirmed_entry("H1", "summary") == (None, None)
+        cache.set_result(
+            "H1", "summary", "parsers.a", {"present": True}, confirmed=True
+        )
+        assert cache.get_confirmed_entry("H1", "summary") == (
+            "parsers.a",
+            {"present": True},
+        )
+        assert cache.get_confirmed_votes_entry("H1", "J10") == (None, None)
+        cache.set_votes_result(
+            "H1", "J10", "parsers.v", {"present": True}, confirmed=True
+        )
+        assert cache.get_confirmed_votes_entry("H1", "J10") == (
+            "parsers.v",
+            {"present": True},
+        )
+
+    def test_confirmed_index_survives_reopen(self, cache, tmp_path):
+        cache.set_result(
+            "H1", "summary", "parsers.a", {"present": True}, confirmed=True
+        )
+        cache.set_votes_result(
+            "H1", "J10", "parsers.v", {"present": False}, confirmed=True
+        )
+        reopened = CacheDB(path=tmp_path / "cache.db")
+        assert reopened.get_confirmed_entry("H1", "summary")[1] == {"present": True}
+        assert reopened.get_confirmed_votes_entry("H1", "J10")[1] == {"present": False}
+
+    def test_unconfirming_drops_entry(self, cache):
+        cache.set_result(
+            "H1", "summary", "parsers.a", {"present": True}, confirmed=True
+        )
+        cache.set_parser("H1", "summary", "parsers.a", confirmed=False)
+        assert cache.get_confirmed_entry("H1", "summary")[1] is None
+        cache.set_parser("H1", "summary", "parsers.a", confirmed=True)
+        assert cache.get_confirmed_entry("H1", "summary")[1] == {"present": True}
+
+    def test_reloaded_module_names_are_interned(self, cache, tmp_path):
+        cache.set_result(
+            "H1", "summary", "parsers.a", {"present": True}, confirmed=True
+        )
+        cache.set_result(
+            "H2", "summary", "parsers.a", {"present": True}, confirmed=True
+        )
+        reopened = CacheDB(path=tmp_path / "cache.db")
+        first = reopened.get_confirmed_parser("H1", "summary")
+        assert first is reopened.get_confirmed_parser("H2", "summary")
+
+    def test_set_result_accepts_model(self, cache):
+        info = SummaryInfo(
+            present=True,
+            location="bill_tab",
+            source_url=None,
+            parser_module="parsers.a",
+        )
+        cache.set_result("H1", "summary", "parsers.a", info, confirmed=True)
+        assert cache.get_confirmed_entry("H1", "summary")[1] == info.to_dict()
+        assert cache.get_result("H1", "summary") == info.to_dict()
+
+
+class TestCommitteeParserStats:
+    """Memoized committee parser stats stay in step with record_committee_parser."""
+
+    def test_miss_returns_empty(self, cache):
+        assert cache.get_committee_parser_stats("J10", "summary", "parsers.a") == {}
+
+    def test_record_invalidates_memo(self, cache):
+        cache.record_committee_parser("J10", "summary", "parsers.a")
+        assert cache.get_committee_parser_stats("J10", "summary", "parsers.a") == {
+            "count": 1,
+            "current_streak": 1,
+        }
+        cache.record_committee_parser("J10", "summary", "parsers.a")
+        assert cache.get_committee_parser_stats("J10", "summary", "parsers.a") == {
+            "count": 2,
+            "current_streak": 2,
+        }
+
+    def test_switching_parser_resets_other_streaks(self, cache):
+        cache.record_committee_parser("J10", "summary", "parsers.a")
+        cache.record_committee_parser("J10", "summary", "parsers.a")
+        cache.get_committee_parser_stats("J10", "summary", "parsers.a")
+        cache.record_committee_parser("J10", "summary", "parsers.b")
+        stats = cache.get_committee_parser_stats("J10", "summary", "parsers.a")
+        assert stats["current_streak"] == 0
+
+    def test_committee_parsers_order_follows_records(self, cache):
+        assert cache.get_committee_parsers("J10", "summary") == []
+        for module in ("a", "b", "b", "c", "c", "c"):
+            cache.record_committee_parser("J10", "summary", f"parsers.{module}")
+        assert cache.get_committee_parsers("J10", "summary") == [
+            "parsers.c",
+            "parsers.b",
+            "parsers.a",
+        ]
+        # a streak of 2 outranks a higher count
+        cache.record_committee_parser("J10", "summary", "parsers.a")
+        cache.record_committee_parser("J10", "summary", "parsers.a")
+        assert cache.get_committee_parsers("J10", "summary") == [
+            "parsers.a",
+            "parsers.c",
+            "parsers.b",
+        ]
+
+    def test_record_success_stores_result_and_credits_parser(self, cache):
+        cache.record_success(
+            "H1", "J10", "summary", "parsers.a", {"present": True}, confirmed=True
+        )
+        cache.record_success(
+            "H1", "J10", "votes", "parsers.v", {"present": False}, confirmed=True
+        )
+        assert not cache._conn.in_transaction
+        assert cache.get_confirmed_entry("H1", "summary")[1] == {"present": True}
+        assert cache.get_confirmed_votes_entry("H1", "J10")[1] == {"present": False}
+        assert cache.get_parser_stats("J10", "summary", "parsers.a")["count"] == 1
+        assert cache.get_parser_stats("J10", "votes", "parsers.v")["count"] == 1
+
+    def test_get_parser_stats_returns_none_on_miss(self, cache):
+        assert cache.get_parser_stats("J10", "summary", "parsers.a") is None
+        cache.record_committee_parser("J10", "summary", "parsers.a")
+        assert cache.get_parser_stats("J10", "summary", "parsers.b") is None
+        assert cache.get_parser_stats("J10", "summary", "parsers.a")["count"] == 1
+
+
+class TestBatchedWrites:
+    """Writes inside batched() share one transaction."""
+
+    def test_commits_on_exit(self, cache, tmp_path):
+        with cache.batched():
+            cache.set_title("H1", "An Act")
+            assert cache._conn.in_transaction
+        assert not cache._conn.in_transaction
+        assert CacheDB(path=tmp_path / "cache.db").get_title("H1") == "An Act"
+
+    def test_nested_batches_commit_once(self, cache):
+        with cache.batched():
+            with cache.batched():
+                cache.set_title("H1", "An Act")
+            assert cache._conn.in_transaction
+        assert not cache._conn.in_transaction
+
+    def test_rolls_back_on_error(self, cache, tmp_path):
+        with pytest.raises(RuntimeError):
+            with cache.batched():
+                cache.set_title("H1", "An Act")
+                raise RuntimeError("boom")
+        assert not cache._conn.in_transaction
+        assert CacheDB(path=tmp_path / "cache.db").get_title("H1") is None
+
+    def test_rollback_resets_confirmed_index(self, cache):
+        with pytest.raises(RuntimeError):
+            with cache.batched():
+                cache.set_result(
+                    "H1", "summary", "parsers.a", {"present": True}, confirmed=True
+                )
+                raise RuntimeError("boom")
+        assert cache.get_confirmed_parser("H1", "summary") is None
+
+    def test_other_threads_wait_for_the_batch(self, cache):
+        worker = threading.Thread(target=cache.set_title, args=("H2", "Other"))
+        with pytest.raises(RuntimeError):
+            with cache.batched():
+                cache.set_title("H1", "An Act")
+                worker.start()
+                worker.join(timeout=0.1)
+                assert worker.is_alive()
+                raise RuntimeError("boom")
+        worker.join()
+        assert cache.get_title("H1") is None
+        assert cache.get_title("H2") == "Other"
+
+
+class TestDiscoverMemoBounds:
+    """The discover memo is an LRU with a TTL."""
+
+    def test_expired_entry_is_recomputed(self, cache):
+        key = ("parsers.votes_bill_pdf", "H1", "J10", "")
+        cache.memoize_discover(key, lambda: "first")
+        stamp, result = cache._discover_memo[key]
+        ttl = cache_module._DISCOVER_MEMO_TTL_SECONDS
+        cache._discover_memo[key] = (stamp - ttl, result)
+        assert cache.memoize_discover(key, lambda: "second") == "second"
+
+    def test_least_recently_used_is_evicted(self, cache, monkeypatch):
+        monkeypatch.setattr(cache_module, "_DISCOVER_MEMO_MAX_ENTRIES", 2)
+        cache.memoize_discover(("a",), lambda: "a")
+        cache.memoize_discover(("b",), lambda: "b")
+        cache.memoize_discover(("a",), lambda: "unused")  # refresh "a"
+        cache.memoize_discover(("c",), lambda: "c")
+        assert list(cache._discover_memo) == [("a",), ("c",)]
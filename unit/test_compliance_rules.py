@@ -1,7 +1,11 @@
 """Test individual compliance rules in isolation."""
 
+from dataclasses import replace
 from datetime import date, timedelta
 
+import pytest
+
+from components.compliance import ComplianceState
 from components.ruleset import (
     NoticeRequirementRule,
     ReportedOutRequirementRule,
@@ -9,6 +13,8 @@ from components.ruleset import (
     SummaryRequirementRule,
     RuleFactory,
     Status,
+    aggregate_to_compliance,
+    classify,
 )
 from unit.fixtures.bill_factory import BillFactory
 
@@ -226,3 +232,123 @@ class TestVoteAndSummaryRules:
         assert result.passed == Status.NON_COMPLIANT
         assert "no summaries" in result.reason.lower()
         assert result.missing_description == "no summaries posted"
+
+
+class TestComplianceRuleSet:
+    """Test rule set evaluation order and short-circuiting."""
+
+    def test_quick_evaluation_stops_at_deal_breaker(self, bill_factory: BillFactory):
+        """A failed notice rule ends evaluation unless thorough is set."""
+        status = bill_factory.create_status(
+            committee_id="J33",
+            hearing_date=date(2025, 7, 15),
+            announcement_date=date(2025, 7, 10),
+        )
+        context = RuleFactory.create_context("H100", "J33")
+        rule_set = RuleFactory.create_rule_set(context)
+        args = (
+            context,
+            status,
+            bill_factory.create_summary(),
+            bill_factory.create_votes(),
+        )
+        quick = rule_set.evaluate(*args, thorough=False)
+        assert [type(rule) for rule, _ in quick] == [NoticeRequirementRule]
+        assert len(rule_set.evaluate(*args)) == len(rule_set.rules)
+
+    def test_rule_set_is_shared_per_committee_type(self):
+        """Bills in committees of the same type reuse one rule set."""
+        joint = RuleFactory.create_rule_set(RuleFactory.create_context("H1", "J33"))
+        house = RuleFactory.create_rule_set(RuleFactory.create_context("H1", "H33"))
+        assert (
+            RuleFactory.create_rule_set(RuleFactory.create_context("S2", "J10"))
+            is joint
+        )
+        assert house is not joint
+        assert not any(isinstance(r, NoticeRequirementRule) for r in house.rules)
+
+    def test_rules_are_ordered_by_priority(self):
+        """Rule metadata is plain class data and drives evaluation order."""
+        rule_set = RuleFactory.create_rule_set(RuleFactory.create_context("H1", "J33"))
+        assert [r.priority for r in rule_set.rules] == [1, 2, 4, 5]
+        assert [r.is_core for r in rule_set.rules] == [False, True, True, True]
+        assert VoteRequirementRule.name == "Vote Requirement"
+
+    def test_aggregation_asks_rules_if_they_are_core(self, bill_factory: BillFactory):
+        """Overriding is_core_requirement() changes what is counted."""
+
+        class OptionalVoteRule(VoteRequirementRule):
+            def is_core_requirement(self) -> bool:
+                return False
+
+        context = RuleFactory.create_context("H100", "H33")
+        status = bill_factory.create_status(
+            committee_id="H33",
+            hearing_date=date(2025, 7, 15),
+            reported_out=True,
+            reported_date=date(2025, 8, 1),
+        )
+        summary = bill_factory.create_summary(present=True)
+        votes = bill_factory.create_votes(present=True)
+        rule_results = RuleFactory.create_rule_set(context).evaluate(
+            context, status, summary, votes
+        )
+        args = (context, status, summary, votes)
+        assert aggregate_to_compliance(rule_results, *args).state == (
+            ComplianceState.COMPLIANT
+        )
+        rule_results = [
+            (OptionalVoteRule() if isinstance(rule, VoteRequirementRule) else rule, res)
+            for rule, res in rule_results
+        ]
+        assert aggregate_to_compliance(rule_results, *args).state == (
+            ComplianceState.NON_COMPLIANT
+        )
+
+    @pytest.mark.parametrize(
+        "bill_id, committee_id, hearing, announced, reported, docs",
+        [
+            ("H100", "J33", "2025-07-15", "2025-07-01", "2025-08-01", True),
+            ("H100", "J33", "2025-07-15", "2025-07-10", "2025-08-01", True),
+            ("H100", "J33", "2025-07-15", "2025-07-10", "2025-10-01", False),
+            ("H100", "J33", "2025-07-15", "2025-07-10", None, True),
+            ("H100", "J33", "2025-06-22", "2025-06-20", "2025-07-01", True),
+            ("H100", "J33", "2025-07-15", None, "2025-08-01", False),
+            ("H100", "J33", None, None, None, True),
+            ("S100", "S33", "2025-07-15", "2025-07-12", None, False),
+            ("H100", "H33", "2025-07-15", "2025-07-14", "2025-08-01", True),
+            # Study order without a hearing after a short-notice announcement
+            ("S100", "J33", None, "2025-07-10", "2025-08-01", False),
+        ],
+    )
+    def test_quick_classification_keeps_state(
+        self,
+        bill_factory: BillFactory,
+        bill_id,
+        committee_id,
+        hearing,
+        announced,
+        reported,
+        docs,
+    ):
+        """Stopping at a deal-breaker never changes the verdict."""
+        status = bill_factory.create_status(
+            bill_id=bill_id,
+            committee_id=committee_id,
+            hearing_date=hearing and date.fromisoformat(hearing),
+            announcement_date=announced and date.fromisoformat(announced),
+            reported_out=reported is not None,
+            reported_date=reported and date.fromisoformat(reported),
+        )
+        if hearing is None and announced is not None:
+            status = replace(status, scheduled_hearing_date=date(2025, 7, 15))
+        args = (
+            bill_id,
+            committee_id,
+            status,
+            bill_factory.create_summary(present=docs),
+            bill_factory.create_votes(present=docs),
+        )
+        thorough = classify(*args)
+        quick = classify(*args, thorough=False)
+        assert quick.state == thorough.state
@@ -0,0 +1,79 @@
+"""Tests for batched LLM decisions."""
+
+import threading
+
+from components.llm import BatchLLMDecider, LLMParser
+
+
+class _FakeParser:
+    """Records each batch instead of calling the LLM."""
+
+    def __init__(self):
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def make_decisions(self, items):
+        with self._lock:
+            self.batches.append(list(items))
+        return ["yes" if "summary" in content else "no" for content, _, _ in items]
+
+
+class TestParseBatchResponse:
+    """Decisions are read from the JSON array in the model's reply."""
+
+    def test_reads_array_amid_text(self):
+        reply = 'Sure:\n[{"id": 0, "decision": "yes"}, {"id": 1, "decision": "NO"}]'
+        assert LLMParser._parse_batch_response(reply) == {0: "yes", 1: "no"}
+
+    def test_drops_invalid_entries(self):
+        reply = '[{"id": 0, "decision": "maybe"}, {"id": "1", "decision": "yes"}, 3]'
+        assert LLMParser._parse_batch_response(reply) == {}
+
+    def test_malformed_json(self):
+        assert LLMParser._parse_batch_response('[{"id": 0,') == {}
+        assert LLMParser._parse_batch_response("yes") == {}
+
+
+class TestBatchLLMDecider:
+    """Concurrent callers share one request; lone callers aren't stranded."""
+
+    def test_full_batch_is_sent_together(self):
+        parser = _FakeParser()
+        decider = BatchLLMDecider(parser, batch_size=3, max_wait=5.0)
+        results = {}
+
+        def ask(i):
+            content = "summary text" if i % 2 == 0 else "other text"
+            results[i] = decider.decide(content, "summary", f"H{i}")
+
+        threads = [threading.Thread(target=ask, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        assert results == {0: "yes", 1: "no", 2: "yes"}
+        assert [len(batch) for batch in parser.batches] == [3]
+
+    def test_submit_does_not_block(self):
+        parser = _FakeParser()
+        decider = BatchLLMDecider(parser, batch_size=2, max_wait=5.0)
+        first = decider.submit("summary text", "summary", "H1")
+        second = decider.submit("other text", "votes", "H2")
+        assert first.result(timeout=10) == "yes"
+        assert second.result(timeout=10) == "no"
+        assert [len(batch) for batch in parser.batches] == [2]
+
+    def test_failed_batch_resolves_to_none(self):
+        class _Broken:
+            def make_decisions(self, items):
+                raise RuntimeError("boom")
+
+        decider = BatchLLMDecider(_Broken(), batch_size=1, max_wait=0.01)
+        assert decider.decide("summary text", "summary", "H1") is None
+        assert decider.decide("summary text", "summary", "H2") is None
+
+    def test_lone_caller_flushes_after_wait(self):
+        parser = _FakeParser()
+        decider = BatchLLMDecider(parser, batch_size=8, max_wait=0.01)
+        assert decider.decide("summary text", "summary", "H1") == "yes"
+        assert parser.batches == [[("summary text", "summary", "H1")]]
@@ -0,0 +1,761 @@
+"""Tests for the summary/votes resolution pipeline."""
+
+import threading
+
+import pytest
+
+from components.extraction import DocumentExtractionService, bill_scope
+from components.interfaces import Config, ParserInterface
+from components.models import BillAtHearing, SummaryInfo, VoteInfo
+from components import pipeline
+from components.pipeline import (
+    ParserTier,
+    PipelineConfig,
+    _SUMMARY_SPEC,
+    _build_parser_sequence,
+    _effective_cost,
+    _tier2_order,
+    _prefetch_discovery,
+    _select_decider,
+    resolve_summary_for_bill,
+    resolve_votes_for_bill,
+    should_consult_llm,
+)
+
+
+@pytest.fixture
+def row():
+    return BillAtHearing(
+        bill_id="H100",
+        bill_label="H.100",
+        bill_url="https://malegislature.gov/Bills/194/H100",
+        committee_id="J10",
+    )
+
+
+class TestConfirmedCacheShortCircuit:
+    """A confirmed cached result is returned without running any parser."""
+
+    def test_summary(self, cache, row):
+        stored = SummaryInfo(
+            present=True,
+            location="bill_tab",
+            source_url="https://example.test/summary",
+            parser_module="parsers.summary_bill_tab_text",
+            needs_review=False,
+        )
+        cache.set_result(
+            row.bill_id,
+            "summary",
+            "parsers.summary_bill_tab_text",
+            stored.to_dict(),
+            confirmed=True,
+        )
+        before = pipeline.get_cache_hit_counts()["summary"]
+        result = resolve_summary_for_bill("https://malegislature.gov", None, cache, row)
+        assert result == stored
+        assert pipeline.get_cache_hit_counts()["summary"] == before + 1
+
+    def test_votes(self, cache, row):
+        stored = VoteInfo(
+            present=True,
+            location="bill_embedded",
+            source_url="https://example.test/votes",
+            parser_module="parsers.votes_bill_embedded",
+            needs_review=False,
+        )
+        cache.set_votes_result(
+            row.bill_id,
+            row.committee_id,
+            "parsers.votes_bill_embedded",
+            stored.to_dict(),
+            confirmed=True,
+        )
+        result = resolve_votes_for_bill("https://malegislature.gov", None, cache, row)
+        assert result == stored
+
+
+class TestPipelineConfig:
+    """PipelineConfig snapshots the Config values the resolvers read."""
+
+    def test_from_config(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            "review_mode: off\n"
+            "parallel_discover: true\n"
+            "deferred_review:\n"
+            "  auto_accept_high_confidence: 0.8\n",
+            encoding="utf-8",
+        )
+        cfg = Config(str(path))
+        pcfg = PipelineConfig.from_config(cfg)
+        assert pcfg.review_mode == cfg.review_mode == "off"
+        assert pcfg.auto_accept_threshold == (
+            cfg.deferred_review.auto_accept_high_confidence
+        )
+        assert pcfg.concurrent_discovery is False
+        assert pcfg.parallel_discover is True
+
+    def test_is_frozen(self):
+        pcfg = PipelineConfig(
+            review_mode="off",
+            auto_accept_threshold=0.9,
+            concurrent_discovery=False,
+            parallel_discover=False,
+        )
+        with pytest.raises(AttributeError):
+            pcfg.review_mode = "on"
+
+
+class TestParseIsSourceOnly:
+    """Parsers flagged parse_is_source_only really just echo the URL."""
+
+    @pytest.mark.parametrize(
+        "parser",
+        [
+            parser
+            for registry in (pipeline.SUMMARY_REGISTRY, pipeline.VOTES_REGISTRY)
+            for parser in registry.values()
+            if parser.parse_is_source_only
+        ],
+        ids=lambda parser: parser.__name__,
+    )
+    def test_parse_returns_candidate_url(self, parser):
+        candidate = ParserInterface.DiscoveryResult(
+            preview="preview",
+            full_text="",
+            source_url="https://example.test/doc.pdf",
+            confidence=0.5,
+        )
+        parsed = parser.parse("https://malegislature.gov", candidate)
+        assert parsed["source_url"] == candidate.source_url
+
+
+class TestPreviewText:
+    """Reviewer previews are bounded regardless of document size."""
+
+    def _candidate(self, preview, full_text):
+        return ParserInterface.DiscoveryResult(
+            preview=preview,
+            full_text=full_text,
+            source_url="https://example.test/doc.pdf",
+            confidence=0.5,
+        )
+
+    def test_prefers_full_text(self):
+        assert self._candidate("short", "longer text").preview_text == "longer text"
+
+    def test_falls_back_to_preview(self):
+        assert self._candidate("short", "").preview_text == "short"
+
+    def test_is_capped(self):
+        cap = ParserInterface.DiscoveryResult.PREVIEW_MAX_CHARS
+        candidate = self._candidate("short", "x" * (cap * 10))
+        assert len(candidate.preview_text) == cap
+
+    def test_effective_confidence_defaults_missing_scores(self):
+        candidate = self._candidate("short", "")
+        assert candidate.effective_confidence == 0.5
+        scored = ParserInterface.DiscoveryResult("short", "", "", confidence=0.9)
+        assert scored.effective_confidence == 0.9
+        unscored = ParserInterface.DiscoveryResult("short", "", "", confidence=0.0)
+        assert unscored.effective_confidence == 0.5
+
+
+class TestSelectDecider:
+    """The acceptance policy is picked once per resolver call."""
+
+    @staticmethod
+    def _pcfg(review_mode):
+        return PipelineConfig(
+            review_mode=review_mode,
+            auto_accept_threshold=0.9,
+            concurrent_discovery=False,
+            parallel_discover=False,
+        )
+
+    def test_modes_map_to_deciders(self):
+        session = object()
+        assert _select_decider(self._pcfg("on"), None) is pipeline._decide_on
+        assert _select_decider(self._pcfg("off"), None) is pipeline._decide_off
+        assert (
+            _select_decider(self._pcfg("deferred"), session)
+            is pipeline._decide_deferred
+        )
+
+    def test_deferred_without_session_auto_accepts(self):
+        assert _select_decider(self._pcfg("deferred"), None) is pipeline._decide_off
+
+    def test_unknown_mode_auto_accepts(self):
+        assert _select_decider(self._pcfg("sometimes"), None) is pipeline._decide_off
+
+
+class TestBillScope:
+    """Parsers resolving one bill share extracted document text."""
+
+    @pytest.fixture
+    def extractions(self, monkeypatch):
+        calls = []
+
+        def fake_extract(url, cache, config, timeout):
+            calls.append(url)
+            return f"text of {url}"
+
+        monkeypatch.setattr(
+            DocumentExtractionService, "_extract_text", staticmethod(fake_extract)
+        )
+        return calls
+
+    def test_reuses_text_inside_scope(self, extractions):
+        with bill_scope():
+            DocumentExtractionService.extract_text("https://example.test/a.pdf")
+            DocumentExtractionService.extract_text("https://example.test/a.pdf")
+        DocumentExtractionService.extract_text("https://example.test/a.pdf")
+        assert len(extractions) == 2
+
+    def test_prefetch_workers_share_scope(self, extractions, cache, row, monkeypatch):
+        def fake_discover(parser, modname, base_url, row, cache, cfg):
+            return DocumentExtractionService.extract_text("https://example.test/a.pdf")
+
+        monkeypatch.setattr(pipeline, "_discover", fake_discover)
+        sequence = [
+            (parser, ParserTier.COST_FALLBACK, modname)
+            for parser, modname, _ in _SUMMARY_SPEC.by_cost
+        ]
+        pcfg = PipelineConfig(
+            review_mode="off",
+            auto_accept_threshold=0.9,
+            concurrent_discovery=False,
+            parallel_discover=True,
+        )
+        with bill_scope():
+            DocumentExtractionService.extract_text("https://example.test/a.pdf")
+            with _prefetch_discovery(sequence, "", row, cache, None, pcfg) as discover:
+                for parser, _, modname in sequence:
+                    discover(parser, modname)
+        assert len(extractions) == 1
+
+
+class TestBuildParserSequence:
+    """Each parser is tried once, at its highest tier."""
+
+    def test_tiers_and_dedup(self, cache, row):
+        modules = [modname for _, modname, _ in _SUMMARY_SPEC.by_cost]
+        cached, proven = modules[-1], modules[-2]
+        cache.record_committee_parser(row.committee_id, "summary", cached)
+        cache.record_committee_parser(row.committee_id, "summary", proven)
+        sequence = _build_parser_sequence(_SUMMARY_SPEC, cache, row, cached)
+        assert [m for _, _, m in sequence[:2]] == [cached, proven]
+        assert [t for _, t, _ in sequence[:2]] == [
+            ParserTier.BILL_CACHED,
+            ParserTier.COMMITTEE_PROVEN,
+        ]
+        assert sorted(m for _, _, m in sequence) == sorted(modules)
+        assert {t for _, t, _ in sequence[2:]} == {ParserTier.COST_FALLBACK}
+
+    def test_unknown_cached_module_is_ignored(self, cache, row):
+        sequence = _build_parser_sequence(
+            _SUMMARY_SPEC, cache, row, "parsers.removed_parser"
+        )
+        assert len(sequence) == len(_SUMMARY_SPEC.by_cost)
+
+    def test_later_tiers_are_looked_up_lazily(self, cache, row, monkeypatch):
+        def fail(*args):
+            raise AssertionError("Tier 2 should not be ordered")
+
+        monkeypatch.setattr(pipeline, "_tier2_order", fail)
+        cached = _SUMMARY_SPEC.by_cost[-1][1]
+        sequence = pipeline._iter_parser_sequence(_SUMMARY_SPEC, cache, row, cached)
+        assert next(sequence)[2] == cached
+
+
+class TestTier2Order:
+    """Tier 2 fallback reorders by observed discover() hit rate."""
+
+    def test_static_cost_order_without_stats(self, cache):
+        assert _tier2_order(_SUMMARY_SPEC, cache) == _SUMMARY_SPEC.by_cost
+
+    def test_hit_rate_overrides_static_cost(self, cache):
+        cheapest = _SUMMARY_SPEC.by_cost[0][1]
+        runner_up = _SUMMARY_SPEC.by_cost[1][1]
+        for _ in range(10):
+            cache.record_discover_attempt("summary", cheapest, found=False)
+            cache.record_discover_attempt("summary", runner_up, found=True)
+        order = [modname for _, modname, _ in _tier2_order(_SUMMARY_SPEC, cache)]
+        assert order[0] == runner_up
+        assert sorted(order) == sorted(m for _, m, _ in _SUMMARY_SPEC.by_cost)
+
+    def test_effective_cost_is_static_cost_without_attempts(self):
+        assert _effective_cost(3, 0, 0) == 3.0
+        assert _effective_cost(3, 4, 0) < 3.0
+        assert _effective_cost(3, 4, 4) > 3.0
+
+
+class TestPrefetchDiscovery:
+    """Concurrent discovery keeps the serial consumption order."""
+
+    def _sequence(self):
+        return [
+            (parser, ParserTier.COST_FALLBACK, modname)
+            for parser, modname, _ in _SUMMARY_SPEC.by_cost
+        ]
+
+    @pytest.mark.parametrize(
+        "concurrent, parallel", [(False, False), (True, False), (False, True)]
+    )
+    def test_each_parser_discovered_once(
+        self, cache, row, monkeypatch, concurrent, parallel
+    ):
+        calls = []
+
+        def fake_discover(parser, modname, base_url, row, cache, cfg):
+            calls.append(modname)
+            return modname
+
+        monkeypatch.setattr(pipeline, "_discover", fake_discover)
+        sequence = self._sequence()
+        sequence[0] = (sequence[0][0], ParserTier.BILL_CACHED, sequence[0][2])
+        pcfg = PipelineConfig(
+            review_mode="off",
+            auto_accept_threshold=0.9,
+            concurrent_discovery=concurrent,
+            parallel_discover=parallel,
+        )
+        with _prefetch_discovery(sequence, "", row, cache, None, pcfg) as discover:
+            results = [discover(p, m) for p, _, m in sequence]
+        assert results == [m for _, _, m in sequence]
+        assert sorted(calls) == sorted(results)
+
+    def test_concurrency_of_one_stays_serial(self, cache, row, monkeypatch):
+        threads = []
+
+        def fake_discover(parser, modname, base_url, row, cache, cfg):
+            threads.append(threading.current_thread().name)
+            return modname
+
+        monkeypatch.setattr(pipeline, "_discover", fake_discover)
+        sequence = self._sequence()
+        pcfg = PipelineConfig(
+            review_mode="off",
+            auto_accept_threshold=0.9,
+            concurrent_discovery=False,
+            parallel_discover=True,
+            discover_concurrency=1,
+        )
+        with _prefetch_discovery(sequence, "", row, cache, None, pcfg) as discover:
+            for parser, _, modname in sequence:
+                discover(parser, modname)
+        assert set(threads) == {threading.current_thread().name}
+
+    def test_running_prefetches_finish_before_exit(self, cache, row, monkeypatch):
+        sequence = self._sequence()
+        slow = sequence[1][2]
+        started = threading.Event()
+        finished = []
+
+        def fake_discover(parser, modname, base_url, row, cache, cfg):
+            if modname == slow:
+                started.set()
+                threading.Event().wait(0.2)
+                finished.append(modname)
+            return modname
+
+        monkeypatch.setattr(pipeline, "_discover", fake_discover)
+        pcfg = PipelineConfig(
+            review_mode="off",
+            auto_accept_threshold=0.9,
+            concurrent_discovery=False,
+            parallel_discover=True,
+            discover_concurrency=2,
+        )
+        with _prefetch_discovery(sequence, "", row, cache, None, pcfg) as discover:
+            discover(sequence[0][0], sequence[0][2])
+            assert started.wait(5)
+        assert finished == [slow]
+
+
+class TestTwoPassLlmDecision:
+    """The LLM sees the preview first and the full text only when unsure."""
+
+    class _Cfg:
+        class llm:
+            preview_window = (800, 400)
+
+    def _candidate(self, full_text):
+        return ParserInterface.DiscoveryResult(
+            preview="short preview",
+            full_text=full_text,
+            source_url="https://example.test/doc",
+            confidence=0.5,
+        )
+
+    def _run(self, monkeypatch, answers, full_text):
+        seen = []
+
+        def fake_ask(content, bill_id, doc_type, config, cache):
+            seen.append(content)
+            return answers[len(seen) - 1]
+
+        monkeypatch.setattr(pipeline, "_ask_llm", fake_ask)
+        decision = pipeline.try_llm_decision(
+            self._candidate(full_text), "H100", "summary", self._Cfg()
+        )
+        return decision, seen
+
+    def test_confident_preview_is_not_escalated(self, monkeypatch):
+        decision, seen = self._run(monkeypatch, ["yes"], "long full text")
+        assert decision == "yes"
+        assert seen == ["short preview"]
+
+    def test_unsure_preview_escalates_to_full_text(self, monkeypatch):
+        decision, seen = self._run(monkeypatch, ["unsure", "no"], "long full text")
+        assert decision == "no"
+        assert seen == ["short preview", "long full text"]
+
+    def test_unsure_without_full_text_stays_unsure(self, monkeypatch):
+        decision, seen = self._run(monkeypatch, ["unsure"], "")
+        assert decision == "unsure"
+        assert seen == ["short preview"]
+
+
+class TestAskLlmCache:
+    """Only a yes or no verdict from the LLM is persisted."""
+
+    class _Cfg:
+        class llm:
+            enabled = True
+            model = "test-model"
+
+        class deferred_review:
+            llm_cache_ttl_days = 30
+
+    @pytest.mark.parametrize(
+        "answer, kept", [("yes", True), ("no", True), ("unsure", False), (None, False)]
+    )
+    def test_persists_only_verdicts(self, cache, monkeypatch, answer, kept):
+        monkeypatch.setattr(pipeline, "_query_llm", lambda *args: answer)
+        assert (
+            pipeline._ask_llm("text", "H100", "summary", self._Cfg(), cache) == answer
+        )
+        key = pipeline._llm_decision_key("text", "summary", "H100", "test-model")
+        stored = cache.get_llm_decision(key, max_age_days=30)
+        assert stored == (answer if kept else None)
+
+
+class TestCompactPreview:
+    """Long documents are cut to a head-and-tail window for the LLM."""
+
+    def test_short_text_unchanged(self):
+        assert pipeline._compact_preview("abc", head=2, tail=1) == "abc"
+
+    def test_long_text_keeps_head_and_tail(self):
+        text = "a" * 10 + "b" * 10 + "c" * 10
+        assert pipeline._compact_preview(text, head=5, tail=3) == "aaaaa\n…\nccc"
+
+    def test_zero_tail(self):
+        assert pipeline._compact_preview("abcdef", head=2, tail=0) == "ab\n…\n"
+
+
+class TestDecideDeferred:
+    """High-confidence candidates are accepted before any LLM work."""
+
+    def test_high_confidence_skips_llm(self, cache, row, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("LLM should not be consulted")
+
+        monkeypatch.setattr(pipeline, "try_llm_decision", fail)
+        monkeypatch.setattr(pipeline, "should_use_llm_for_parser", fail)
+        candidate = ParserInterface.DiscoveryResult(
+            preview="preview",
+            full_text="",
+            source_url="https://example.test/doc.pdf",
+            confidence=0.95,
+        )
+        pending = []
+        decision = pipeline._decide_deferred(
+            _SUMMARY_SPEC,
+            None,
+            cache,
+            row,
+            candidate,
+            "parsers.summary_bill_tab_text",
+            ParserTier.COST_FALLBACK,
+            {},
+            pending,
+            PipelineConfig(
+                review_mode="deferred",
+                auto_accept_threshold=0.9,
+                concurrent_discovery=False,
+                parallel_discover=False,
+            ),
+        )
+        assert decision == (True, False)
+        assert pending == []
+
+    @pytest.mark.parametrize("confidence, asks_llm", [(0.85, True), (0.95, False)])
+    def test_default_threshold_from_config(
+        self, cache, row, monkeypatch, tmp_path, confidence, asks_llm
+    ):
+        path = tmp_path / "config.yaml"
+        path.write_text('review_mode: "deferred"\n', encoding="utf-8")
+        pcfg = PipelineConfig.from_config(Config(str(path)))
+        asked = []
+
+        def ask(*args, **kwargs):
+            asked.append(1)
+            return "yes"
+
+        monkeypatch.setattr(pipeline, "should_use_llm_for_parser", lambda *a: True)
+        monkeypatch.setattr(pipeline, "try_llm_decision", ask)
+        candidate = ParserInterface.DiscoveryResult(
+            preview="preview",
+            full_text="",
+            source_url="https://example.test/doc.pdf",
+            confidence=confidence,
+        )
+        decision = pipeline._decide_deferred(
+            _SUMMARY_SPEC,
+            None,
+            cache,
+            row,
+            candidate,
+            "parsers.summary_bill_tab_text",
+            ParserTier.COST_FALLBACK,
+            {},
+            [],
+            pcfg,
+        )
+        assert decision == (True, False)
+        assert bool(asked) is asks_llm
+
+
+class TestTrustedParser:
+    """A committee's only proven parser is run alone once it has enough wins."""
+
+    _MODULE = "parsers.summary_bill_tab_text"
+
+    @staticmethod
+    def _pcfg(review_mode="on", fast_path_threshold=3):
+        return PipelineConfig(
+            review_mode=review_mode,
+            auto_accept_threshold=0.9,
+            concurrent_discovery=False,
+            parallel_discover=False,
+            fast_path_threshold=fast_path_threshold,
+        )
+
+    def _patch_discover(self, monkeypatch, confidence):
+        calls = []
+
+        def discover(parser, modname, *args):
+            calls.append(modname)
+            return ParserInterface.DiscoveryResult(
+                preview="preview",
+                full_text="",
+                source_url="https://example.test/summary",
+                confidence=confidence,
+            )
+
+        monkeypatch.setattr(pipeline, "_discover", discover)
+        return calls
+
+    def _try(self, cache, row, pcfg=None, needs_review=False):
+        return pipeline._try_trusted_parser(
+            _SUMMARY_SPEC,
+            "https://malegislature.gov",
+            None,
+            cache,
+            row,
+            None,
+            pcfg or self._pcfg(),
+            needs_review,
+        )
+
+    def test_accepts_without_confirming(self, cache, row, monkeypatch):
+        for _ in range(3):
+            cache.record_committee_parser(row.committee_id, "summary", self._MODULE)
+        calls = self._patch_discover(monkeypatch, 0.95)
+        before = pipeline.get_fast_path_hit_counts()["summary"]
+        result = self._try(cache, row)
+        assert calls == [self._MODULE]
+        assert result.parser_module == self._MODULE
+        assert cache.get_parser(row.bill_id, "summary") == self._MODULE
+        assert cache.get_confirmed_parser(row.bill_id, "summary") is None
+        assert pipeline.get_fast_path_hit_counts()["summary"] == before + 1
+
+    def test_headless_result_is_not_confirmed(self, cache, row, monkeypatch):
+        for _ in range(3):
+            cache.record_committee_parser(row.committee_id, "summary", self._MODULE)
+        self._patch_discover(monkeypatch, 0.95)
+        result = self._try(cache, row, self._pcfg("off"), needs_review=True)
+        assert result.needs_review
+        assert cache.get_parser(row.bill_id, "summary") == self._MODULE
+        assert cache.get_confirmed_parser(row.bill_id, "summary") is None
+
+    def test_off_by_default(self, cache, row, monkeypatch):
+        for _ in range(10):
+            cache.record_committee_parser(row.committee_id, "summary", self._MODULE)
+        calls = self._patch_discover(monkeypatch, 0.95)
+        pcfg = PipelineConfig(
+            review_mode="on",
+            auto_accept_threshold=0.9,
+            concurrent_discovery=False,
+            parallel_discover=False,
+        )
+        assert self._try(cache, row, pcfg) is None
+        assert calls == []
+
+    def test_needs_enough_history(self, cache, row, monkeypatch):
+        for _ in range(2):
+            cache.record_committee_parser(row.committee_id, "summary", self._MODULE)
+        calls = self._patch_discover(monkeypatch, 0.95)
+        assert self._try(cache, row) is None
+        assert calls == []
+
+    def test_needs_a_single_parser(self, cache, row, monkeypatch):
+        for module in ("parsers.other", self._MODULE, self._MODULE, self._MODULE):
+            cache.record_committee_parser(row.committee_id, "summary", module)
+        calls = self._patch_discover(monkeypatch, 0.95)
+        assert self._try(cache, row) is None
+        assert calls == []
+
+    def test_low_confidence_falls_back(self, cache, row, monkeypatch):
+        for _ in range(3):
+            cache.record_committee_parser(row.committee_id, "summary", self._MODULE)
+        self._patch_discover(monkeypatch, 0.5)
+        assert self._try(cache, row) is None
+        assert cache.get_parser(row.bill_id, "summary") is None
+
+    def test_missing_confidence_falls_back(self, cache, row, monkeypatch):
+        for _ in range(3):
+            cache.record_committee_parser(row.committee_id, "summary", self._MODULE)
+        self._patch_discover(monkeypatch, None)
+        assert self._try(cache, row) is None
+
+
+class TestParserErrors:
+    """A parser that raises is skipped instead of aborting the bill."""
+
+    _MODULE = "parsers.summary_bill_tab_text"
+
+    class _Flaky:
+        parse_is_source_only = False
+
+        @staticmethod
+        def probe(*args):
+            raise RuntimeError("site down")
+
+        @staticmethod
+        def parse(*args):
+            raise RuntimeError("bad document")
+
+    def test_discover_error_counts_as_a_miss(self, cache, row):
+        candidate = pipeline._discover(self._Flaky, self._MODULE, "", row, cache, None)
+        assert candidate is None
+        assert cache.get_discover_stats("summary")[self._MODULE] == (1, 1)
+
+    def test_parse_error_returns_none(self):
+        candidate = ParserInterface.DiscoveryResult(
+            preview="preview",
+            full_text="",
+            source_url="https://example.test/doc.pdf",
+            confidence=0.5,
+        )
+        assert pipeline._parse(self._Flaky, self._MODULE, "", candidate) is None
+
+    def test_parse_error_in_off_mode_falls_through(self, cache, row, monkeypatch):
+        candidate = ParserInterface.DiscoveryResult(
+            preview="preview",
+            full_text="",
+            source_url="https://example.test/doc.pdf",
+            confidence=0.5,
+        )
+        monkeypatch.setattr(
+            pipeline,
+            "_iter_parser_sequence",
+            lambda *args: iter([(self._Flaky, ParserTier.COST_FALLBACK, self._MODULE)]),
+        )
+        monkeypatch.setattr(pipeline, "_discover", lambda *args: candidate)
+        pcfg = PipelineConfig(
+            review_mode="off",
+            auto_accept_threshold=0.9,
+            concurrent_discovery=False,
+            parallel_discover=False,
+        )
+        result = resolve_summary_for_bill("", None, cache, row, pipeline_cfg=pcfg)
+        assert not result.present
+        assert cache.get_parser(row.bill_id, "summary") is None
+
+
+class TestShouldConsultLlm:
+    """The LLM gate over primitive inputs."""
+
+    def test_bill_cached_only_when_very_suspicious(self):
+        assert should_consult_llm(ParserTier.BILL_CACHED, 0.2, 0, 0)
+        assert not should_consult_llm(ParserTier.BILL_CACHED, 0.5, 0, 0)
+
+    def test_cost_fallback_always(self):
+        assert should_consult_llm(ParserTier.COST_FALLBACK, 1.0, 10, 10)
+
+    def test_committee_learning_phase(self):
+        assert should_consult_llm(ParserTier.COMMITTEE_PROVEN, 0.9, 2, 10)
+        assert should_consult_llm(ParserTier.COMMITTEE_PROVEN, 0.9, 3, 4)
+
+    def test_committee_established_uses_confidence(self):
+        assert not should_consult_llm(ParserTier.COMMITTEE_PROVEN, 0.5, 3, 5)
+        assert should_consult_llm(ParserTier.COMMITTEE_PROVEN, 0.4, 3, 5)
+
+
+class TestProbe:
+    """A parser's probe() can rule it out before discover() runs."""
+
+    def _parser(self, probe_result):
+        calls = []
+
+        class FakeParser:
+            parser_type = ParserInterface.ParserType.VOTES
+
+            @classmethod
+            def probe(cls, base_url, bill, cache=None, config=None):
+                return probe_result
+
+            @classmethod
+            def discover(cls, base_url, bill, cache=None, config=None):
+                calls.append(bill.bill_id)
+                return "candidate"
+
+        return FakeParser, calls
+
+    def test_negative_probe_skips_discover(self, cache, row):
+        parser, calls = self._parser(False)
+        assert pipeline._discover(parser, "fake", "", row, cache, None) is None
+        assert calls == []
+        assert cache.get_discover_stats("votes") == {"fake": (1, 1)}
+
+    @pytest.mark.parametrize("probe_result", [None, True])
+    def test_inconclusive_probe_runs_discover(self, cache, row, probe_result):
+        parser, calls = self._parser(probe_result)
+        assert pipeline._discover(parser, "fake", "", row, cache, None) == "candidate"
+        assert calls == [row.bill_id]
+
+    @pytest.mark.parametrize(
+        "parser",
+        [
+            parser
+            for registry in (pipeline.SUMMARY_REGISTRY, pipeline.VOTES_REGISTRY)
+            for parser in registry.values()
+            if "probe" in vars(parser)
+        ],
+        ids=lambda parser: parser.__name__,
+    )
+    def test_hearing_parsers_skip_bills_without_hearing(
+        self, cache, row, monkeypatch, parser
+    ):
+        def fail(*args, **kwargs):
+            raise AssertionError("no page should be fetched")
+
+        monkeypatch.setattr(parser, "soup", fail)
+        assert row.hearing_url is None
+        assert (
+            pipeline._discover(parser, parser.__module__, "", row, cache, None) is None
+        )
@@ -0,0 +1,61 @@
+"""Tests for the basic compliance HTML report."""
+
+from components.models import CommitteeContact
+from components.report import write_basic_html
+
+
+def _row(**overrides):
+    row = {
+        "bill_id": "H100",
+        "bill_title": "An Act relative to <script> & 'quotes'",
+        "bill_url": "https://malegislature.gov/Bills/194/H100",
+        "hearing_date": "2025-03-01",
+        "deadline_60": "2025-04-30",
+        "effective_deadline": "2025-04-30",
+        "extension_order_url": None,
+        "reported_out": False,
+        "summary_present": True,
+        "summary_url": "https://example.test/summary?a=1&b=2",
+        "votes_present": False,
+        "votes_url": None,
+        "state": "non-compliant",
+        "reason": "No votes posted <yet>",
+        "notice_status": "in_range",
+        "notice_gap_days": 12,
+    }
+    row.update(overrides)
+    return row
+
+
+def _contact():
+    return CommitteeContact(
+        committee_id="J10",
+        name="Joint Committee",
+        chamber="Joint",
+        url="https://malegislature.gov/Committees/Detail/J10",
+    )
+
+
+class TestWriteBasicHtml:
+    """The report renders one escaped table row per bill."""
+
+    def test_row_fields_are_escaped(self, tmp_path):
+        out = tmp_path / "report.html"
+        write_basic_html(
+            "Joint Committee", "J10", "https://example.test", _contact(), [_row()], out
+        )
+        html = out.read_text(encoding="utf-8")
+        assert "An Act relative to &lt;script&gt; &amp; &#x27;quotes&#x27;" in html
+        assert "No votes posted &lt;yet&gt;" in html
+        assert "href='https://example.test/summary?a=1&amp;b=2'" in html
+        assert "<script>" not in html
+
+    def test_one_row_per_bill(self, tmp_path):
+        out = tmp_path / "report.html"
+        rows = [_row(bill_id=f"H{i}") for i in range(3)]
+        write_basic_html(
+            "Joint Committee", "J10", "https://example.test", _contact(), rows, out
+        )
+        html = out.read_text(encoding="utf-8")
+        assert html.count("<tr>") == len(rows) + 1
+        assert html.endswith("</table>")
@@ -0,0 +1,90 @@
+"""Tests for the deferred batch review session."""
+
+from types import SimpleNamespace
+
+from components import review
+from components.interfaces import ParserInterface
+from components.models import DeferredConfirmation, DeferredReviewSession
+
+
+def _config(group_by_bill=False):
+    return SimpleNamespace(
+        deferred_review=SimpleNamespace(
+            show_confidence=True, group_by_bill=group_by_bill
+        )
+    )
+
+
+def _session(*entries):
+    session = DeferredReviewSession(session_id="s1", committee_id="J10")
+    for i, (bill_id, parser_type) in enumerate(entries):
+        session.add_confirmation(
+            DeferredConfirmation(
+                confirmation_id=f"c{i}",
+                bill_id=bill_id,
+                parser_type=parser_type,
+                parser_module=f"parsers.m{i}",
+                candidate=ParserInterface.DiscoveryResult(
+                    "preview", "", "https://example.test/doc.pdf", 0.5
+                ),
+                preview_text="preview",
+                confidence=0.5,
+            )
+        )
+    return session
+
+
+def _answer(monkeypatch, *answers):
+    replies = iter(answers)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(replies))
+
+
+class TestConductBatchReview:
+    """Accepted parsers are confirmed in the cache."""
+
+    def test_accepted_parsers_are_confirmed(self, cache, monkeypatch, capsys):
+        session = _session(("H1", "summary"), ("H2", "votes"), ("H3", "summary"))
+        _answer(monkeypatch, "", "y", "y", "n")
+        results = review.conduct_batch_review(session, _config(), cache)
+        assert results == {"c0": True, "c1": True, "c2": False}
+        assert cache.is_confirmed("H1", "summary")
+        assert cache.is_votes_confirmed("H2", "J10")
+        assert not cache.is_confirmed("H3", "summary")
+        review.apply_review_results(results, session, cache)
+        assert "Accepted: 2" in capsys.readouterr().out
+
+    def test_accepts_made_before_quitting_are_kept(self, cache, monkeypatch):
+        session = _session(("H1", "summary"), ("H2", "summary"))
+        _answer(monkeypatch, "", "yes", "q")
+        assert review.conduct_batch_review(session, _config(), cache) == {"c0": True}
+        assert cache.is_confirmed("H1", "summary")
+
+    def test_writes_are_flushed_in_batches(self, cache, monkeypatch):
+        monkeypatch.setattr(review, "_CONFIRM_BATCH_SIZE", 2)
+        session = _session(*[(f"H{i}", "summary") for i in range(5)])
+        _answer(monkeypatch, "", *["y"] * 5)
+        batches = []
+        confirm = review._confirm_parsers
+
+        def record(accepted, committee_id, cache):
+            batches.append(len(accepted))
+            confirm(accepted, committee_id, cache)
+
+        monkeypatch.setattr(review, "_confirm_parsers", record)
+        review.conduct_batch_review(session, _config(), cache)
+        assert [size for size in batches if size] == [2, 2, 1]
+        assert all(cache.is_confirmed(f"H{i}", "summary") for i in range(5))
+
+    def test_accept_all_skips_remaining_prompts_for_the_bill(self, cache, monkeypatch):
+        session = _session(("H1", "summary"), ("H2", "summary"), ("H1", "votes"))
+        _answer(monkeypatch, "", "a", "n")  # no answer left for the second H1
+        results = review.conduct_batch_review(session, _config(), cache)
+        assert results == {"c0": True, "c1": False, "c2": True}
+        assert cache.is_votes_confirmed("H1", "J10")
+
+    def test_already_confirmed_parser_is_not_prompted(self, cache, monkeypatch):
+        session = _session(("H1", "summary"), ("H2", "summary"))
+        cache.set_parser("H1", "summary", "parsers.m0", confirmed=True)
+        _answer(monkeypatch, "", "n")  # only H2 is shown
+        results = review.conduct_batch_review(session, _config(), cache)
+        assert results == {"c0": True, "c1": False}